@@ -4,7 +4,7 @@ from __future__ import annotations
 import datetime
 import inspect
 from collections.abc import Callable, Sequence
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, TypeAlias
 
 import numpy as np
@@ -59,6 +59,24 @@ IS_POST_HANDLER: dict[Callable[..., Any], bool] = {}
 # --- CONSTANTS ---
 earths_radius = 6371008.8  # m
 
+# Types answerable with a single isinstance check in is_scalar_like;
+# datetime.date covers datetime.datetime and np.generic covers the NumPy
+# scalar types. Zero-dimensional ndarrays and the pandas NA singletons
+# need the extra handling below.
+_SCALAR_TYPES = (
+    int,
+    float,
+    bool,
+    str,
+    bytes,
+    type(None),
+    np.generic,
+    pd.Timestamp,
+    pd.Timedelta,
+    datetime.date,
+    datetime.time,
+)
+
 
 def is_scalar_like(x: Any) -> bool:
     """
@@ -95,28 +113,13 @@ def is_scalar_like(x: Any) -> bool:
     bool
         True if `x` is scalar-like, False otherwise.
     """
-    if isinstance(x, (str, bytes)):
+    if isinstance(x, _SCALAR_TYPES):
         return True
 
     if isinstance(x, np.ndarray):
         return x.ndim == 0
 
-    if isinstance(x, (int, float, bool, type(None))):
-        return True
-
-    if isinstance(x, np.generic):
-        return True
-
-    if isinstance(x, (pd.Timestamp, pd.Timedelta)):
-        return True
-
-    if x is pd.NA or x is pd.NaT:
-        return True
-
-    if isinstance(x, (datetime.date, datetime.datetime, datetime.time)):
-        return True
-
-    return False
+    return x is pd.NA or x is pd.NaT
 
 
 def isvalid(inval: ValueNumberType) -> bool | npt.NDArray[np.bool_]:
@@ -137,6 +140,14 @@ def isvalid(inval: ValueNumberType) -> bool | npt.NDArray[np.bool_]:
     if inval is None:
         return False
 
+    # Plain numeric scalars dominate the calls from convert_to and the QC
+    # cores; answer them without the pandas round-trip. NaN is the only
+    # float that compares unequal to itself.
+    if isinstance(inval, (float, np.floating)):
+        return bool(inval == inval)
+    if isinstance(inval, (int, np.integer)):
+        return True
+
     if isinstance(inval, pd.Series):
         inval_arr = inval.to_numpy()
     else:
@@ -216,6 +227,12 @@ def format_return_type(
         if dtype is not None:
             return dtype(result_array)
 
+    # ndarray in, ndarray out is the dominant case once inputs have been
+    # through inspect_arrays; answer it before the isinstance chain runs.
+    # Subclasses still take the full dispatch below.
+    if type(input_value) is np.ndarray and type(result_array) is np.ndarray:
+        return result_array
+
     if isinstance(input_value, pd.Series):
         if keep_index is True and isinstance(result_array, pd.Series):
             index = result_array.index
@@ -239,6 +256,45 @@ def format_return_type(
     return result_array  # np.ndarray or fallback
 
 
+@lru_cache(maxsize=128)
+def _conversion_coefficients(source_units: str, target_units: str) -> tuple[float, float] | None:
+    """
+    Derive affine conversion coefficients between two units.
+
+    Probes the unit registry at three points and returns ``(scale, offset)``
+    such that ``converted = value * scale + offset``, or None if the
+    conversion is not affine (or not resolvable). Cached so each unit pair
+    pays the registry parse only once.
+
+    Parameters
+    ----------
+    source_units : str
+        The unit(s) of the input value, e.g., 'degC', 'km/h'.
+    target_units : str
+        The unit(s) to convert to, e.g., 'K', 'm/s'.
+
+    Returns
+    -------
+    tuple of (float, float) or None
+        Scale and offset of the affine conversion, or None if the unit pair
+        cannot be expressed that way.
+    """
+    try:
+        registry = units(source_units)
+        at_zero = float(convert_units_to(0.0 * registry, target_units))
+        at_one = float(convert_units_to(1.0 * registry, target_units))
+        at_two = float(convert_units_to(2.0 * registry, target_units))
+    except Exception:
+        return None
+
+    offset = at_zero
+    scale = at_one - at_zero
+    if not np.isclose(at_two, 2.0 * scale + offset, rtol=1e-12, atol=1e-12):
+        return None
+
+    return scale, offset
+
+
 def convert_to(value: SequenceNumberType, source_units: str, target_units: str) -> SequenceNumberType:
     """
     Convert a float or sequence from source units to target units.
@@ -292,16 +348,60 @@ def convert_to(value: SequenceNumberType, source_units: str, target_units: str)
         """
         if not isvalid(value):
             return value
+        if coefficients is not None:
+            return value * coefficients[0] + coefficients[1]
         return convert_units_to(value * registry, target_units)
 
-    registry = units(source_units)
-    if target_units == "unknown":
-        target_units = registry.to_base_units()
+    def _convert_array(arr: np.ndarray) -> np.ndarray:
+        """
+        Convert units of a float array in one vectorized operation.
+
+        Parameters
+        ----------
+        arr : numpy.ndarray
+            Float array to be converted.
+
+        Returns
+        -------
+        numpy.ndarray
+            Converted array.
+        """
+        if coefficients is not None:
+            return arr * coefficients[0] + coefficients[1]
+        return np.asarray(convert_units_to(arr * registry, target_units))
+
+    if source_units == target_units:
+        return value
+
+    # Affine unit pairs (the common case) convert with two cached floats
+    # instead of a registry round-trip per value
+    coefficients = None if target_units == "unknown" else _conversion_coefficients(source_units, target_units)
+    if coefficients is not None and isinstance(value, (int, float)):
+        if value != value:  # NaN passes through unchanged
+            return value
+        return value * coefficients[0] + coefficients[1]
+    registry = None
+    if coefficients is None:
+        registry = units(source_units)
+        if target_units == "unknown":
+            target_units = registry.to_base_units()
 
     if isinstance(value, np.ndarray):
+        # Numeric dtypes convert in one vectorized operation; object arrays
+        # (which may hold None entries) keep the per-element loop
+        if value.dtype.kind in "if":
+            return _convert_array(value)
         return np.array([_convert_to(v) for v in value])
     if isinstance(value, (list, tuple)):
+        # Purely numeric sequences also convert in one array operation; any
+        # None (or other non-numeric) entry keeps the per-element loop so it
+        # passes through unchanged
+        if all(isinstance(v, (int, float, np.integer, np.floating)) for v in value):
+            return type(value)(_convert_array(np.asarray(value, dtype=float)).tolist())
         return type(value)([_convert_to(v) for v in value])
+    if isinstance(value, pd.Series):
+        converted = _convert_array(value.to_numpy(dtype=float, na_value=np.nan))
+        return pd.Series(converted, index=value.index, name=value.name)
     return _convert_to(value)
 
 
@@ -369,6 +469,80 @@ def generic_decorator(
         if post_handler:
             handlers.append(post_handler)
 
+        # The signature never changes after decoration, so resolve it once
+        # here instead of on every call.
+        sig = inspect.signature(func)
+
+        # Functions whose parameters are all plain positional-or-keyword can
+        # be bound with dict operations instead of Signature.bind, which
+        # dominates the per-call overhead. Anything unusual (or any call that
+        # would not bind cleanly) falls back to sig.bind so error behaviour
+        # is unchanged.
+        parameters = list(sig.parameters.values())
+        param_names = tuple(parameter.name for parameter in parameters)
+        param_name_set = frozenset(param_names)
+        param_defaults = {parameter.name: parameter.default for parameter in parameters if parameter.default is not inspect.Parameter.empty}
+        simple_bind = all(parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD for parameter in parameters)
+
+        def fast_bind(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any] | None:
+            r"""
+            Bind call arguments to parameter names without Signature.bind.
+
+            Parameters
+            ----------
+            args : tuple
+                Positional arguments of the call.
+            kwargs : dict
+                Keyword arguments of the call.
+
+            Returns
+            -------
+            dict or None
+                The bound arguments in parameter order with defaults applied,
+                or None if the call does not bind cleanly and needs the full
+                Signature.bind treatment.
+            """
+            if len(args) > len(param_names):
+                return None
+            bound = dict(zip(param_names, args))
+            for key, val in kwargs.items():
+                if key in bound or key not in param_name_set:
+                    return None
+                bound[key] = val
+            arguments: dict[str, Any] = {}
+            for name in param_names:
+                if name in bound:
+                    arguments[name] = bound[name]
+                elif name in param_defaults:
+                    arguments[name] = param_defaults[name]
+                else:
+                    return None
+            return arguments
+
+        # The chain below this wrapper is already complete when the decorator
+        # runs (decorators apply bottom-up), so the inherited handlers, their
+        # reserved keywords and the pre/post split can all be resolved here
+        # instead of on every call.
+        all_handlers: list[Callable[..., Any]] = list(handlers)
+        current_func: Any = func
+        visited: set[int] = set()
+        while hasattr(current_func, "__wrapped__") and id(current_func) not in visited:
+            visited.add(id(current_func))
+            all_handlers.extend(DECORATOR_HANDLERS.get(current_func, []))
+            current_func = current_func.__wrapped__
+
+        all_pre_handlers: list[Callable[..., Any]] = []
+        all_post_handlers: list[Callable[..., Any]] = []
+        reserved_key_set: set[str] = set()
+        for handler in all_handlers:
+            if handler in DECORATOR_KWARGS:
+                reserved_key_set.update(DECORATOR_KWARGS[handler])
+            if IS_POST_HANDLER.get(handler, False):
+                all_post_handlers.append(handler)
+            else:
+                all_pre_handlers.append(handler)
+        reserved_keys = frozenset(reserved_key_set)
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             r"""
@@ -402,41 +576,36 @@ def generic_decorator(
             - Pre-handlers receive the arguments dictionary (`bound_args.arguments`) and reserved kwargs.
             - Post-handlers receive the function result, the current arguments, and the original arguments.
             """
-            reserved_keys: set[str] = set()
-            all_pre_handlers: list[Callable[..., Any]] = []
-            all_post_handlers: list[Callable[..., Any]] = []
-
-            current_func: Any = wrapper
-            visited: set[int] = set()
-
-            while hasattr(current_func, "__wrapped__") and id(current_func) not in visited:
-                visited.add(id(current_func))
-                for handler in DECORATOR_HANDLERS.get(current_func, []):
-                    if handler in DECORATOR_KWARGS:
-                        reserved_keys.update(DECORATOR_KWARGS[handler])
-                    if IS_POST_HANDLER.get(handler, False):
-                        all_post_handlers.append(handler)
-                    else:
-                        all_pre_handlers.append(handler)
-
-                current_func = current_func.__wrapped__
-
-            sig = inspect.signature(func)
             meta_kwargs = {k: kwargs.pop(k) if k not in sig.parameters else kwargs[k] for k in reserved_keys if k in kwargs}
 
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            original_call = bound_args.arguments.copy()
+            bound_args = None
+            arguments = fast_bind(args, kwargs) if simple_bind else None
+            if arguments is None:
+                bound_args = sig.bind(*args, **kwargs)
+                bound_args.apply_defaults()
+                arguments = bound_args.arguments
+
+            # Post-handlers need the arguments as they were before any
+            # pre-handler mutated them; only then is a copy required.
+            if not all_post_handlers:
+                original_call = {}
+            elif all_pre_handlers:
+                original_call = dict(arguments)
+            else:
+                original_call = arguments
 
             for handler in reversed(all_pre_handlers):
                 DECORATOR_NAMES[handler] = func.__name__
-                handler(bound_args.arguments, **meta_kwargs)
+                handler(arguments, **meta_kwargs)
 
-            result = func(*bound_args.args, **bound_args.kwargs)
+            if bound_args is None:
+                result = func(**{name: arguments[name] for name in param_names})
+            else:
+                result = func(*bound_args.args, **bound_args.kwargs)
 
             for handler in reversed(all_post_handlers):
                 DECORATOR_NAMES[handler] = func.__name__
-                result = handler(result, bound_args.arguments, **original_call)
+                result = handler(result, arguments, **original_call)
 
             return result
 
@@ -596,21 +765,37 @@ def inspect_arrays(*params: str, sortby: str | None = None) -> Callable[..., Any
                 raise ValueError(f"Parameter '{param}' is not a valid parameter.")
 
             value = arguments[param]
-            arr = np.atleast_1d(arguments[param])
+            if isinstance(value, np.ndarray) and value.ndim == 1:
+                arr = value
+            else:
+                arr = np.atleast_1d(value)
 
             arguments[param] = arr
             if value is not None:
                 arrays.append(arr)
 
-        lengths = [len(arr) for arr in arrays]
-        if any(length != lengths[0] for length in lengths):
+        lengths = {len(arr) for arr in arrays}
+        if len(lengths) > 1:
             raise ValueError(f"Input {params} must all have the same length.")
 
         if sortby:
             unsorted_array = arguments[sortby]
-            indices = np.argsort(unsorted_array)
+            sort_key = unsorted_array
+            if unsorted_array.dtype.kind == "M" and not np.isnat(unsorted_array).any():
+                # Sort datetimes on their integer representation; skipped when
+                # NaT is present since NaT sorts last but its integer value
+                # sorts first.
+                sort_key = unsorted_array.view("i8")
+            indices = np.argsort(sort_key)
             for param in params:
                 arguments[param] = arguments[param][indices]
+            # Invert the permutation here so the post-handler can restore the
+            # original order without sorting the same key a second time. The
+            # extra entry is ignored when the wrapped function is called and
+            # is popped again by the post-handler.
+            inverse_indices = np.empty_like(indices)
+            inverse_indices[indices] = np.arange(len(indices))
+            arguments["_inspect_arrays_inverse"] = inverse_indices
 
     def post_handler(result: Any, arguments: dict[str, Any], **original_call: Any) -> Any:
         r"""
@@ -633,8 +818,10 @@ def inspect_arrays(*params: str, sortby: str | None = None) -> Callable[..., Any
         """
         if sortby is None:
             return result
-        sort_indices = np.argsort(original_call[sortby])
-        inverse_indices = np.argsort(sort_indices)
+        inverse_indices = arguments.pop("_inspect_arrays_inverse", None)
+        if inverse_indices is None:
+            sort_indices = np.argsort(original_call[sortby])
+            inverse_indices = np.argsort(sort_indices)
         if len(result) == 0:
             return result
         return result[inverse_indices]
@@ -717,21 +904,29 @@ def convert_units(**units_by_name: str) -> Callable[..., Any]:
         units_dict = meta_kwargs.get("units")
         if units_dict is None:
             return
+        # A single string applies to every argument; keep it as a default
+        # instead of expanding it into a per-call dict
+        default_units = None
         if isinstance(units_dict, str):
-            units_str = units_dict
-            units_dict = {param: units_str for param in arguments}
+            default_units = units_dict
+            units_dict = None
 
         for param, target_units in units_by_name.items():
             if param not in arguments:
                 raise ValueError(f"Parameter '{param}' not found in function arguments.")
-            if param not in units_dict:
+            if units_dict is None:
+                source_units = default_units
+            elif param in units_dict:
+                source_units = units_dict[param]
+            else:
                 continue
 
             value = arguments[param]
             if value is None:
                 continue
 
-            source_units = units_dict[param]
+            if source_units == target_units:
+                continue
 
             converted = convert_to(value, source_units, target_units)
 
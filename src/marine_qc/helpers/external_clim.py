@@ -4,8 +4,8 @@ from __future__ import annotations
 import inspect
 import os
 import warnings
-from collections import defaultdict
 from collections.abc import Callable, Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, TypeAlias
 
@@ -13,7 +13,6 @@ import cf_xarray  # noqa: F401
 import numpy as np
 import pandas as pd
 import xarray as xr
-from joblib import Parallel, delayed
 from numpy import ndarray
 from xclim.core.units import convert_units_to
 
@@ -27,52 +26,55 @@ from .auxiliary import (
     ValueIntType,
     ValueNumberType,
     generic_decorator,
+    is_scalar_like,
     isvalid,
     post_format_return_type,
 )
 from .time_control import (
     convert_date,
-    day_in_year,
     day_in_year_array,
     get_month_lengths,
-    which_pentad,
     which_pentad_array,
 )
 
+_ML_LEAP = np.array(get_month_lengths(2004))
 
-def _select_point(
-    i: int,
-    da_slice: xr.DataArray,
-    lat_arr: SequenceNumberType,
-    lon_arr: SequenceNumberType,
-    lat_axis: str,
-    lon_axis: str,
-) -> tuple[int, float]:
+#: Files smaller than this are loaded eagerly into NumPy, skipping dask.
+_EAGER_LOAD_MAX_BYTES = 128 * 1024 * 1024
+
+
+def _nearest_index(coords: np.ndarray, values: np.ndarray) -> np.ndarray:
     """
-    Select nearest grid point value for a single lat/lon pair.
+    Find the indices of the grid points in `coords` nearest to `values`.
 
     Parameters
     ----------
-    i : int
-        Index of the latitude/longitude pair.
-    da_slice : xarray.DataArray
-        DataArray slice to sample from.
-    lat_arr : :py:obj:`~marine_qc.SequenceNumberType`
-        Array of latitude values.
-    lon_arr : :py:obj:`~marine_qc.SequenceNumberType`
-        Array of longitude values.
-    lat_axis : str
-        Name of the latitude dimension in `da_slice`.
-    lon_axis : str
-        Name of the longitude dimension in `da_slice`.
+    coords : numpy.ndarray
+        Monotonically ascending or descending coordinate axis.
+    values : numpy.ndarray
+        Values to locate on the axis.
 
     Returns
     -------
-    tuple of (int, float)
-        Index i and the selected grid-point value.
+    numpy.ndarray
+        Array of indices into `coords`, one per entry in `values`.
+
+    Notes
+    -----
+    Matches the selection behaviour of ``.sel(method="nearest")``: values
+    outside the axis are clamped to the first or last grid point and ties are
+    broken towards the higher coordinate value.
     """
-    sel = da_slice.sel({lat_axis: lat_arr[i], lon_axis: lon_arr[i]}, method="nearest")
-    return i, float(sel.values)
+    coords = np.asarray(coords, dtype=float)
+    if coords.size == 1:
+        return np.zeros(np.shape(values), dtype=int)
+    if coords[0] > coords[-1]:
+        return coords.size - 1 - _nearest_index(coords[::-1], values)
+    pos = np.searchsorted(coords, values)
+    pos = np.clip(pos, 1, coords.size - 1)
+    left = coords[pos - 1]
+    right = coords[pos]
+    return pos - ((values - left) < (right - values))
 
 
 def _empty_dataarray() -> xr.DataArray:
@@ -105,6 +107,56 @@ def _empty_dataarray() -> xr.DataArray:
     )
 
 
+@lru_cache(maxsize=100_000)
+def _get_value_fast_cached(climatology: Climatology, **meta_kwargs: Any) -> float:
+    r"""
+    Memoized scalar climatology lookup.
+
+    Many observations in a batch share the same grid cell and time step, so
+    repeated scalar resolutions of the same key are answered from a bounded
+    cache instead of re-gathering from the climatology. The cache is keyed
+    by object identity and cleared by
+    :py:func:`~marine_qc.Climatology.convert_units_to`, which mutates the
+    climatology in place.
+
+    Parameters
+    ----------
+    climatology : :py:class:`~marine_qc.Climatology`
+        Climatology to sample from; keyed by object identity.
+    \**meta_kwargs : dict
+        Scalar keyword arguments passed to :py:func:`~marine_qc.Climatology.get_value_fast`.
+
+    Returns
+    -------
+    float
+        Climatology value at the specified location and time.
+    """
+    return climatology.get_value_fast(**meta_kwargs)
+
+
+@lru_cache(maxsize=None)
+def _required_get_value_keys(cls: type) -> frozenset[str]:
+    """
+    Get the required keyword arguments of ``cls.get_value_fast``, cached per class.
+
+    Parameters
+    ----------
+    cls : type
+        Climatology class (or subclass) whose `get_value_fast` signature is inspected.
+
+    Returns
+    -------
+    frozenset of str
+        Names of parameters without default values.
+    """
+    get_value_sig = inspect.signature(cls.get_value_fast)
+    return frozenset(
+        name
+        for name, param in get_value_sig.parameters.items()
+        if name != "self" and param.default is param.empty and param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+    )
+
+
 def inspect_climatology(
     *climatology_keys: str,
     optional: str | Sequence[str] | None = None,
@@ -168,6 +220,9 @@ def inspect_climatology(
       a warning is issued.
     - If resolution fails due to `TypeError` or `ValueError`,
       the value is replaced with numpy.nan.
+    - Array-valued keyword arguments (e.g. `lat`, `lon`, `date`) are resolved
+      in a single batched `.get_value_fast()` call; callers should prefer
+      passing whole arrays over invoking the decorated function per row.
     """
     if isinstance(optional, str):
         optional = [optional]
@@ -225,13 +280,7 @@ def inspect_climatology(
                 climatology = Climatology.open_netcdf_file(climatology, **clim_kwargs)
 
             if isinstance(climatology, Climatology):
-                get_value_sig = inspect.signature(climatology.get_value_fast)
-                required_keys = {
-                    name
-                    for name, param in get_value_sig.parameters.items()
-                    if param.default is param.empty and param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
-                }
-                missing_in_kwargs = required_keys - meta_kwargs.keys()
+                missing_in_kwargs = _required_get_value_keys(type(climatology)) - meta_kwargs.keys()
                 if missing_in_kwargs:
                     warnings.warn(
                         f"The following required key-word arguments for 'Climatology.get_value' are missing "
@@ -241,7 +290,12 @@ def inspect_climatology(
                     )
 
                 try:
-                    climatology = climatology.get_value_fast(**meta_kwargs)
+                    # 0-d ndarrays are scalar-like but unhashable, so they
+                    # cannot form a cache key and take the direct call
+                    if all(is_scalar_like(value) and not isinstance(value, np.ndarray) for value in meta_kwargs.values()):
+                        climatology = _get_value_fast_cached(climatology, **meta_kwargs)
+                    else:
+                        climatology = climatology.get_value_fast(**meta_kwargs)
                 except (TypeError, ValueError):
                     climatology = np.nan
 
@@ -304,7 +358,10 @@ def open_xrdataset(
     data_vars : {"minimal", "different", "all"} or list of str, default: "minimal"
       See the documentation for :py:func:`xarray.open_mfdataset`.
     chunks : int, dict, "auto" or None, optional, default: "default"
-      If ``chunks`` is ``"default"``, chunks are set to ``{"time": 1}``.
+      If ``chunks`` is ``"default"``, chunks are set to ``{}`` so that dask
+      adopts the engine's preferred chunking, which matches the on-disk
+      (NetCDF/HDF5) chunk layout. Pass an explicit mapping such as
+      ``{"time": 1}`` to override.
       See the documentation for :py:func:`xarray.open_mfdataset`.
     coords : {"minimal", "different", "all"} or list of str, optional, default: "minimal"
       See the documentation for :py:func:`xarray.open_mfdataset`.
@@ -339,7 +396,7 @@ def open_xrdataset(
         return ds.reset_coords(drop=True)
 
     if chunks == "default":
-        chunks = {"time": 1}
+        chunks = {}
 
     ds = xr.open_mfdataset(
         files,
@@ -479,10 +536,23 @@ class Climatology:
           A Climatology instance constructed from the specified variable in
           the NetCDF file. If the file cannot be opened, an empty climatology
           object is returned.
+
+        Notes
+        -----
+        Files smaller than ``_EAGER_LOAD_MAX_BYTES`` are loaded eagerly into
+        memory without dask; wrapping a few-megabyte climatology in a dask
+        graph only adds task overhead to every value lookup. Larger files
+        keep the lazy, chunked representation.
         """
         try:
-            ds = open_xrdataset(file_name)
+            eager = os.path.getsize(file_name) < _EAGER_LOAD_MAX_BYTES
+        except OSError:
+            eager = False
+        try:
+            ds = open_xrdataset(file_name, chunks=None if eager else "default")
             da = ds[clim_name]
+            if eager:
+                da = da.load()
             return cls(da, **kwargs)
         except OSError:
             warnings.warn(f"Could not open: {file_name}.", stacklevel=2)
@@ -505,10 +575,29 @@ class Climatology:
         For more information see: :py:func:`xclim.core.units.convert_units_to`
         """
         if target_units is None:
+            self._values = self._lats = self._lons = None
             return
         if source_units is not None:
             self.data.attrs["units"] = source_units
         self.data = convert_units_to(self.data, target_units)
+        self._values = self._lats = self._lons = None
+        # Cached scalar lookups are keyed on this object and would keep
+        # returning values in the old units
+        _get_value_fast_cached.cache_clear()
+
+    def _load_arrays(self) -> None:
+        """
+        Cache the climatology values and coordinate axes as NumPy arrays.
+
+        The data are transposed to (time, latitude, longitude) order and
+        stored contiguously, so repeated value lookups index raw C arrays
+        instead of going through xarray. The cache is built on first use and
+        reset by :py:func:`~marine_qc.Climatology.convert_units_to`.
+        """
+        data = self.data.transpose(self.time_axis, self.lat_axis, self.lon_axis, ..., missing_dims="ignore")
+        self._values = np.ascontiguousarray(data.values)
+        self._lats = data.coords[self.lat_axis].data
+        self._lons = data.coords[self.lon_axis].data
 
     @post_format_return_type("lat", dtype=float)
     @convert_date("month", "day")
@@ -546,13 +635,11 @@ class Climatology:
         Assumes that the grid is a regular latitude longitude grid. The alternative method `get_value`
         works with non-regular grids.
         """
-        lat = np.array(lat, dtype=float)
+        lat = np.asarray(lat, dtype=float)
         lat_arr = np.atleast_1d(lat)  # type: np.ndarray
-        lat_arr = np.where(lat_arr is None, np.nan, lat_arr).astype(float)
 
-        lon = np.array(lon, dtype=float)
+        lon = np.asarray(lon, dtype=float)
         lon_arr = np.atleast_1d(lon)  # type: np.ndarray
-        lon_arr = np.where(lon_arr is None, np.nan, lon_arr).astype(float)
 
         if month is None and day is None:
             if self.ntime > 1:
@@ -561,16 +648,14 @@ class Climatology:
             month = self.data[self.time_axis].dt.month.values
             day = self.data[self.time_axis].dt.day.values
 
-        month = np.array(month, dtype=object)
-        month_arr = np.atleast_1d(month)  # type: np.ndarray
-        month_arr = np.where(month_arr is None, np.nan, month_arr).astype(float)
+        month = np.asarray(month, dtype=object)
+        month_arr = np.atleast_1d(month).astype(float)  # type: np.ndarray
         month_arr = np.where(np.isnan(month_arr), -1, month_arr).astype(int)
         if len(month_arr) == 1 and len(month_arr) != len(lat_arr):
             month_arr = np.repeat(month_arr, len(lat_arr))
 
-        day = np.array(day, dtype=object)
-        day_arr = np.atleast_1d(day)  # type: np.ndarray
-        day_arr = np.where(day_arr is None, np.nan, day_arr).astype(float)
+        day = np.asarray(day, dtype=object)
+        day_arr = np.atleast_1d(day).astype(float)  # type: np.ndarray
         day_arr = np.where(np.isnan(day_arr), -1, day_arr).astype(int)
         if len(day_arr) == 1 and len(day_arr) != len(lat_arr):
             day_arr = np.repeat(day_arr, len(lat_arr))
@@ -578,9 +663,8 @@ class Climatology:
         valid = isvalid(lat) & isvalid(lon) & isvalid(month) & isvalid(day)
         valid &= (month_arr >= 1) & (month_arr <= 12)
 
-        ml = np.array(get_month_lengths(2004))
         month_lengths = np.zeros_like(month_arr)
-        month_lengths[valid] = ml[month_arr[valid] - 1]
+        month_lengths[valid] = _ML_LEAP[month_arr[valid] - 1]
 
         valid &= (day_arr >= 1) & (day_arr <= month_lengths)
         valid &= (lon_arr >= -180) & (lon_arr <= 180)
@@ -588,8 +672,11 @@ class Climatology:
 
         result = np.full(lat_arr.shape, np.nan, dtype=float)  # type: np.ndarray
 
-        lat_axis = self.data.coords[self.lat_axis].data
-        lon_axis = self.data.coords[self.lon_axis].data
+        if self._values is None:
+            self._load_arrays()
+
+        lat_axis = self._lats
+        lon_axis = self._lons
         if lat_axis.size == 0 or lon_axis.size == 0:
             return result
 
@@ -601,15 +688,15 @@ class Climatology:
         lon_indices = np.array(lon_indices, dtype=int)
         time_indices = np.array(time_indices, dtype=int)
 
-        lat_mask = np.isin(lat_indices, np.arange(len(self.data[self.lat_axis])))
-        lon_mask = np.isin(lon_indices, np.arange(len(self.data[self.lon_axis])))
-        time_mask = np.isin(time_indices, np.arange(len(self.data[self.time_axis])))
+        lat_mask = np.isin(lat_indices, np.arange(lat_axis.size))
+        lon_mask = np.isin(lon_indices, np.arange(lon_axis.size))
+        time_mask = np.isin(time_indices, np.arange(self.ntime))
 
         coord_mask = lat_mask & lon_mask & time_mask
         valid_indices = np.where(valid)[0]
         valid[valid_indices] &= coord_mask
 
-        result[valid] = self.data.values[time_indices[coord_mask], lat_indices[coord_mask], lon_indices[coord_mask]]
+        result[valid] = self._values[time_indices[coord_mask], lat_indices[coord_mask], lon_indices[coord_mask]]
 
         return result
 
@@ -749,55 +836,77 @@ class Climatology:
         -----
         Use only exact matches for selecting time and nearest valid index value for selecting location.
         """
-        lat = np.array(lat, dtype=float)
+        lat = np.asarray(lat, dtype=float)
         lat_arr = np.atleast_1d(lat)  # type: np.ndarray
-        lat_arr = np.where(lat_arr is None, np.nan, lat_arr).astype(float)
 
-        lon = np.array(lon, dtype=float)
+        lon = np.asarray(lon, dtype=float)
         lon_arr = np.atleast_1d(lon)  # type: np.ndarray
-        lon_arr = np.where(lon_arr is None, np.nan, lon_arr).astype(float)
 
-        month = np.array(month, dtype=object)
-        month_arr = np.atleast_1d(month)  # type: np.ndarray
-        month_arr = np.where(month_arr is None, np.nan, month_arr).astype(float)
+        month = np.asarray(month, dtype=object)
+        month_arr = np.atleast_1d(month).astype(float)  # type: np.ndarray
         month_arr = np.where(np.isnan(month_arr), -1, month_arr).astype(int)
+        if len(month_arr) == 1 and len(month_arr) != len(lat_arr):
+            month_arr = np.repeat(month_arr, len(lat_arr))
 
-        day = np.array(day, dtype=object)
-        day_arr = np.atleast_1d(day)  # type: np.ndarray
-        day_arr = np.where(day_arr is None, np.nan, day_arr).astype(float)
+        day = np.asarray(day, dtype=object)
+        day_arr = np.atleast_1d(day).astype(float)  # type: np.ndarray
         day_arr = np.where(np.isnan(day_arr), -1, day_arr).astype(int)
-
-        ml = get_month_lengths(2004)
-        month_lengths = np.array([ml[m - 1] if 1 <= m <= 12 else 0 for m in month_arr])
+        if len(day_arr) == 1 and len(day_arr) != len(lat_arr):
+            day_arr = np.repeat(day_arr, len(lat_arr))
 
         valid = isvalid(lat) & isvalid(lon) & isvalid(month) & isvalid(day)
         valid &= (month_arr >= 1) & (month_arr <= 12)
+
+        month_lengths = np.zeros_like(month_arr)
+        month_lengths[valid] = _ML_LEAP[month_arr[valid] - 1]
+
         valid &= (day_arr >= 1) & (day_arr <= month_lengths)
         valid &= (lon_arr >= -180) & (lon_arr <= 180)
         valid &= (lat_arr >= -90) & (lat_arr <= 90)
 
         result = np.full(lat_arr.shape, np.nan, dtype=float)  # type: np.ndarray
 
-        valid_idx = np.where(valid)[0]
-        if len(valid_idx) == 0:
+        if not valid.any():
             return result
 
-        grouped = defaultdict(list)
-        for i in valid_idx:
-            tindex = self.get_tindex(month_arr[i], day_arr[i])
-            grouped[tindex].append(i)
+        if self._values is None:
+            self._load_arrays()
 
-        data = self.data.load()
+        if self._lats.size == 0 or self._lons.size == 0:
+            return result
 
-        for tindex, indices in grouped.items():
-            da_slice = data.isel({self.time_axis: tindex})
+        time_indices = self.get_tindex_array(month_arr[valid], day_arr[valid])
+        lat_indices = _nearest_index(self._lats, lat_arr[valid])
+        lon_indices = _nearest_index(self._lons, lon_arr[valid])
 
-            results = Parallel(n_jobs=-1)(delayed(_select_point)(i, da_slice, lat_arr, lon_arr, self.lat_axis, self.lon_axis) for i in indices)
-            for idx, value in results:
-                result[idx] = value
+        result[valid] = self._values[time_indices, lat_indices, lon_indices]
 
         return result
 
+    def get_tindex_array(self, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+        """
+        Get the time indices of the input month and day arrays.
+
+        Parameters
+        ----------
+        month : numpy.ndarray
+            Array of months for which the time indices are required.
+        day : numpy.ndarray
+            Array of days for which the time indices are required.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of time indices for the specified months and days.
+        """
+        month = np.atleast_1d(month)
+        day = np.atleast_1d(day)
+        if self.ntime == 1:
+            return np.zeros(month.shape, dtype=int)
+        if self.ntime == 73:
+            return np.asarray(which_pentad_array(month, day) - 1, dtype=int)
+        return np.asarray(day_in_year_array(month=month, day=day) - 1, dtype=int)
+
     def get_tindex(self, month: int, day: int) -> int:
         """
         Get the time index of the input month and day.
@@ -814,11 +923,7 @@ class Climatology:
         int
             Time index for specified month and day.
         """
-        if self.ntime == 1:
-            return 0
-        if self.ntime == 73:
-            return which_pentad(month, day) - 1
-        return day_in_year(month=month, day=day) - 1
+        return int(self.get_tindex_array(month, day)[0])
 
 
 @inspect_climatology("climatology")
@@ -3,6 +3,13 @@ Quality control suite spherical geometry module.
 
 The spherical geometry module is a simple collection of calculations on a sphere
 Sourced from https://edwilliams.org/avform147.htm formerly williams.best.vwh.net/avform.htm
+
+The public functions accept scalars, sequences, arrays or Series and are
+vectorized over array inputs. Each has an underscore-prefixed core
+(e.g. :py:func:`_sphere_distance`) taking plain float ndarrays; internal
+batch callers use the cores directly to avoid per-call decorator overhead.
+The trigonometry itself runs inside pyproj's compiled geodesic routines,
+which process whole arrays in one native call.
 """
 
 from __future__ import annotations
@@ -13,17 +20,15 @@ from pyproj import Geod
 from .auxiliary import (
     SequenceFloatType,
     SequenceNumberType,
-    convert_to,
     earths_radius,
     ensure_arrays,
     inspect_arrays,
-    is_scalar_like,
-    isvalid,
     post_format_return_type,
 )
 
 
 radians_per_degree = np.pi / 180.0
+two_pi = 2.0 * np.pi
 geod = Geod(a=earths_radius, b=earths_radius)
 
 
@@ -60,6 +65,99 @@ def _geod_inv(
     return fwd_az, back_az, dist
 
 
+def _geod_dist(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate the great-circle distance in metres for arrays of points.
+
+    All inputs are processed in a single vectorized ``geod.inv`` call on the
+    valid subset; invalid rows are NaN in the output.
+
+    Parameters
+    ----------
+    lat1, lon1, lat2, lon2 : numpy.ndarray
+        Latitudes and longitudes of the two points in degrees.
+
+    Returns
+    -------
+    numpy.ndarray
+        Great-circle distance between the two points in metres.
+        NaN is returned for any invalid input values.
+    """
+    lat1 = np.asarray(lat1, dtype=float)
+    lon1 = np.asarray(lon1, dtype=float)
+    lat2 = np.asarray(lat2, dtype=float)
+    lon2 = np.asarray(lon2, dtype=float)
+
+    valid = ~(np.isnan(lon1) | np.isnan(lat1) | np.isnan(lon2) | np.isnan(lat2))
+
+    if valid.all():
+        return np.asarray(_geod_inv(lon1, lat1, lon2, lat2)[2], dtype=float)
+
+    result = np.full(lat1.shape, np.nan, dtype=float)  # np.ndarray
+
+    result[valid] = _geod_inv(lon1[valid], lat1[valid], lon2[valid], lat2[valid])[2]
+    return result
+
+
+def _angular_distance(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate the great-circle angular distance in radians for arrays of points.
+
+    Undecorated core of :py:func:`angular_distance` operating on float ndarrays.
+    Internal callers that already hold plain arrays can use this directly to
+    skip the decorator machinery.
+
+    Parameters
+    ----------
+    lat1, lon1, lat2, lon2 : numpy.ndarray
+        Latitudes and longitudes of the two points in degrees.
+
+    Returns
+    -------
+    numpy.ndarray
+        Angular great-circle distance between the two points in radians.
+        NaN is returned for any invalid input values.
+    """
+    return _geod_dist(lat1, lon1, lat2, lon2) / earths_radius
+
+
+def _sphere_distance(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate the great-circle distance in kilometres for arrays of points.
+
+    Undecorated core of :py:func:`sphere_distance` operating on float ndarrays.
+    Internal callers that already hold plain arrays can use this directly to
+    skip the decorator machinery.
+
+    Parameters
+    ----------
+    lat1, lon1, lat2, lon2 : numpy.ndarray
+        Latitudes and longitudes of the two points in degrees.
+
+    Returns
+    -------
+    numpy.ndarray
+        Great-circle distance between the two points in kilometres.
+        NaN is returned for any invalid input values.
+    """
+    return _geod_dist(lat1, lon1, lat2, lon2) / 1000.0
+
+
 @post_format_return_type("lat1", "lon1", "lat2", "lon2", dtype=float)
 @inspect_arrays("lat1", "lon1", "lat2", "lon2")
 def angular_distance(
@@ -95,15 +193,15 @@ def angular_distance(
     ------
     TypeError
         If `inspect_arrays` does not return numpy ndarrays.
+
+    Notes
+    -----
+    Array-valued inputs are evaluated in a single vectorized pass; callers
+    should prefer passing whole arrays over looping element-wise.
     """
     lat1, lon1, lat2, lon2 = ensure_arrays(lat1=lat1, lon1=lon1, lat2=lat2, lon2=lon2)
 
-    valid = isvalid(lon1) & isvalid(lat1) & isvalid(lon2) & isvalid(lat2)
-
-    result = np.full(lat1.shape, np.nan, dtype=float)  # np.ndarray
-
-    result[valid] = _geod_inv(lon1[valid], lat1[valid], lon2[valid], lat2[valid])[2] / earths_radius
-    return result
+    return _angular_distance(lat1, lon1, lat2, lon2)
 
 
 @post_format_return_type("lat1", "lon1", "lat2", "lon2", dtype=float)
@@ -145,15 +243,68 @@ def sphere_distance(
     ------
     TypeError
         If `inspect_arrays` does not return numpy ndarrays.
+
+    Notes
+    -----
+    Array-valued inputs are evaluated in a single vectorized pass; callers
+    should prefer passing whole arrays over looping element-wise.
     """
     lat1, lon1, lat2, lon2 = ensure_arrays(lat1=lat1, lon1=lon1, lat2=lat2, lon2=lon2)
 
-    valid = isvalid(lon1) & isvalid(lat1) & isvalid(lon2) & isvalid(lat2)
+    return _sphere_distance(lat1, lon1, lat2, lon2)
 
-    result = np.full(lat1.shape, np.nan, dtype=float)  # np.ndarray
 
-    result[valid] = _geod_inv(lon1[valid], lat1[valid], lon2[valid], lat2[valid])[2] / 1000.0
-    return result
+def _intermediate_point(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+    f: float | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute intermediate points along great-circle paths for arrays of points.
+
+    Undecorated core of :py:func:`intermediate_point` operating on float
+    ndarrays. Internal callers that already hold plain arrays can use this
+    directly to skip the decorator machinery.
+
+    Parameters
+    ----------
+    lat1, lon1, lat2, lon2 : numpy.ndarray
+        Latitudes and longitudes of the two points in degrees.
+    f : float or numpy.ndarray
+        Fraction of distance between the two points.
+
+    Returns
+    -------
+    tuple of (numpy.ndarray, numpy.ndarray)
+        Latitude(s) and longitude(s) of the intermediate point(s) in degrees.
+        NaN is returned for any invalid input values.
+    """
+    lat1 = np.asarray(lat1, dtype=float)
+    lon1 = np.asarray(lon1, dtype=float)
+    lat2 = np.asarray(lat2, dtype=float)
+    lon2 = np.asarray(lon2, dtype=float)
+
+    valid = ~(np.isnan(lon1) | np.isnan(lat1) | np.isnan(lon2) | np.isnan(lat2))
+    valid &= f <= 1.0
+    valid &= f >= 0.0
+
+    lon_f = np.full(lat1.shape, np.nan, dtype=float)  # np.ndarray
+    lat_f = np.full(lat1.shape, np.nan, dtype=float)  # np.ndarray
+
+    lon1_valid = lon1[valid]
+    lat1_valid = lat1[valid]
+
+    fwd_az, _, dist = geod.inv(lon1_valid, lat1_valid, lon2[valid], lat2[valid])
+
+    f_arr = np.asarray(f, dtype=float)
+    if f_arr.shape == valid.shape:
+        f_arr = f_arr[valid]
+    distance_at_f = dist * f_arr
+
+    lon_f[valid], lat_f[valid], _ = geod.fwd(lon1_valid, lat1_valid, fwd_az, distance_at_f)
+    return lat_f, lon_f
 
 
 @post_format_return_type("lat1", "lon1", "lat2", "lon2", "f", dtype=float, multiple=True)
@@ -200,18 +351,75 @@ def intermediate_point(
     """
     lat1, lon1, lat2, lon2 = ensure_arrays(lat1=lat1, lon1=lon1, lat2=lat2, lon2=lon2)
 
-    valid = isvalid(lon1) & isvalid(lat1) & isvalid(lon2) & isvalid(lat2)
-    valid &= f <= 1.0
-    valid &= f >= 0.0
+    return _intermediate_point(lat1, lon1, lat2, lon2, f)
 
-    lon_f = np.full(lat1.shape, np.nan, dtype=float)  # np.ndarray
-    lat_f = np.full(lat1.shape, np.nan, dtype=float)  # np.ndarray
 
-    fwd_az, _, dist = geod.inv(lon1, lat1, lon2, lat2)
-    distance_at_f = dist * f
+def _course_and_distance(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate initial course and great-circle distance in one geodesic call.
 
-    lon_f[valid], lat_f[valid], _ = geod.fwd(lon1[valid], lat1[valid], fwd_az[valid], distance_at_f[valid])
-    return lat_f, lon_f
+    Fused core for callers that need both :py:func:`course_between_points`
+    and :py:func:`sphere_distance` for the same point pairs; the shared
+    ``geod.inv`` evaluation runs once instead of twice.
+
+    Parameters
+    ----------
+    lat1, lon1, lat2, lon2 : numpy.ndarray
+        Latitudes and longitudes of the two points in degrees.
+
+    Returns
+    -------
+    tuple of (numpy.ndarray, numpy.ndarray)
+        Initial true course in degrees at point one and great-circle
+        distance between the two points in kilometres. The distance is NaN
+        for any invalid input values.
+    """
+    lat1 = np.asarray(lat1, dtype=float)
+    lon1 = np.asarray(lon1, dtype=float)
+    lat2 = np.asarray(lat2, dtype=float)
+    lon2 = np.asarray(lon2, dtype=float)
+
+    fwd_az, _, dist = _geod_inv(lon1, lat1, lon2, lat2)
+    dist = np.asarray(dist, dtype=float) / 1000.0
+
+    valid = ~(np.isnan(lon1) | np.isnan(lat1) | np.isnan(lon2) | np.isnan(lat2))
+    if not valid.all():
+        dist = np.where(valid, dist, np.nan)
+
+    return np.asarray(fwd_az, dtype=float), dist
+
+
+def _course_between_points(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate the initial true course in degrees for arrays of points.
+
+    Undecorated core of :py:func:`course_between_points` operating on float
+    ndarrays. Internal callers that already hold plain arrays can use this
+    directly to skip the decorator machinery.
+
+    Parameters
+    ----------
+    lat1, lon1, lat2, lon2 : numpy.ndarray
+        Latitudes and longitudes of the two points in degrees.
+
+    Returns
+    -------
+    numpy.ndarray
+        Initial true course in degrees at point one along the great circle
+        between point one and point two.
+    """
+    fwd_azimuth, _, _ = _geod_inv(lon1, lat1, lon2, lat2)
+    return fwd_azimuth
 
 
 @post_format_return_type("lat1", "lon1", "lat2", "lon2", dtype=float)
@@ -249,8 +457,56 @@ def course_between_points(
     """
     lat1, lon1, lat2, lon2 = ensure_arrays(lat1=lat1, lon1=lon1, lat2=lat2, lon2=lon2)
 
-    fwd_azimuth, _, _ = geod.inv(lon1, lat1, lon2, lat2)
-    return fwd_azimuth
+    return _course_between_points(lat1, lon1, lat2, lon2)
+
+
+def _lat_lon_from_course_and_distance(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    tc: float | np.ndarray | None,
+    d: float | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the endpoint from a starting point, true course and distance.
+
+    Undecorated core of :py:func:`lat_lon_from_course_and_distance` operating
+    on float ndarrays. Internal callers that already hold plain arrays can use
+    this directly to skip the decorator machinery.
+
+    Parameters
+    ----------
+    lat1, lon1 : numpy.ndarray
+        Latitude and longitude of the starting point in degrees.
+    tc : float or numpy.ndarray or None
+        True course measured clockwise from north in degrees.
+    d : float or numpy.ndarray
+        Distance travelled in kilometres.
+
+    Returns
+    -------
+    tuple of (numpy.ndarray, numpy.ndarray)
+        Latitude(s) and longitude(s) of the endpoint(s) in degrees.
+    """
+    lat_rad = np.deg2rad(lat1)
+    lon_rad = np.deg2rad(lon1)
+
+    if tc is None:
+        tc_rad = np.array([np.nan], dtype=float)
+    else:
+        tc_rad = np.deg2rad(np.asarray(tc, dtype=float))
+
+    d_rad = d / earths_radius * 1000
+
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+    sin_d = np.sin(d_rad)
+    cos_d = np.cos(d_rad)
+
+    lat_trig = np.arcsin(sin_lat * cos_d + cos_lat * sin_d * np.cos(tc_rad))
+    dlon = np.arctan2(np.sin(tc_rad) * sin_d * cos_lat, cos_d - sin_lat * np.sin(lat_trig))
+    lon_trig = np.mod(lon_rad + dlon + np.pi, two_pi) - np.pi
+
+    return np.rad2deg(lat_trig), np.rad2deg(lon_trig)
 
 
 @post_format_return_type("lat1", "lon1", dtype=float, multiple=True)
@@ -294,23 +550,4 @@ def lat_lon_from_course_and_distance(
     """
     lat1, lon1 = ensure_arrays(lat1=lat1, lon1=lon1)
 
-    lat_rad: np.ndarray = np.asarray(convert_to(lat1, "deg", "rad"), dtype=float)
-    lon_rad: np.ndarray = np.asarray(convert_to(lon1, "deg", "rad"), dtype=float)
-
-    tc_converted = convert_to(tc, "deg", "rad")
-    if tc_converted is None:
-        tc_converted = [np.nan]
-    elif is_scalar_like(tc_converted):
-        tc_converted = [tc_converted]
-    tc_rad: np.ndarray = np.array(tc_converted, dtype=float)
-
-    d_rad = d / earths_radius * 1000
-
-    lat_trig = np.arcsin(np.sin(lat_rad) * np.cos(d_rad) + np.cos(lat_rad) * np.sin(d_rad) * np.cos(tc_rad))
-    dlon = np.arctan2(np.sin(tc_rad) * np.sin(d_rad) * np.cos(lat_rad), np.cos(d_rad) - np.sin(lat_rad) * np.sin(lat_trig))
-    lon_trig = np.mod(lon_rad + dlon + np.pi, 2.0 * np.pi) - np.pi
-
-    lat_deg: np.ndarray = np.array(convert_to(lat_trig, "rad", "deg"), dtype=float)
-    lon_deg: np.ndarray = np.array(convert_to(lon_trig, "rad", "deg"), dtype=float)
-
-    return lat_deg, lon_deg
+    return _lat_lon_from_course_and_distance(lat1, lon1, tc, d)
@@ -5,7 +5,9 @@ from collections.abc import Callable, Iterable, Iterator, Mapping
 from typing import Any, Literal, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
+from joblib import Parallel, delayed
 
 from ..helpers.auxiliary import failed, passed, untested
 from ..helpers.external_clim import get_climatological_value  # noqa: F401
@@ -51,22 +53,24 @@ from .qc_sequential_reports import (  # noqa: F401
     find_saturated_runs,
 )
 from .validations import (
-    is_func_param,
-    is_in_data,
+    _func_params,
     validate_args,
     validate_dict,
 )
 
+# Callables resolvable by name from QC and preprocessing configurations,
+# frozen at import time so _get_function is a single dict lookup
+_QC_REGISTRY: dict[str, Callable[..., Any]] = {name: obj for name, obj in dict(globals()).items() if callable(obj) and name.startswith(("do_", "find_", "get_"))}
+
 
 def _apply_qc_to_masked_rows(
     qc_func: Callable[..., Any],
     args: Mapping[str, Any],
     kwargs: Mapping[str, Any],
-    data_index: pd.Index,
-    mask: pd.Series,
-) -> pd.Series:
+    mask: npt.ArrayLike,
+) -> np.ndarray:
     """
-    Apply a QC function to masked rows and return a Series aligned to ``data_index``.
+    Apply a QC function and keep its results only for masked rows.
 
     Parameters
     ----------
@@ -76,26 +80,18 @@ def _apply_qc_to_masked_rows(
         Keyword arguments constructed from requests.
     kwargs : Mapping[str, Any]
         Additional keyword arguments, typically from preprocessed variables.
-    data_index : pandas.Index
-        Full index of the dataset for aligning the QC result.
-    mask : pandas.Series
+    mask : array-like of bool
         Boolean mask indicating which rows the QC function applies to.
 
     Returns
     -------
-    pandas.Series
-        A Series indexed by ``data_index`` containing QC results for masked rows
-        and default values elsewhere.
+    numpy.ndarray
+        ``int8`` array containing QC results for masked rows and the
+        untested flag elsewhere.
     """
-    partial = qc_func(**args, **kwargs)
-
-    partial = pd.Series(partial, index=data_index)
-
-    full = pd.Series(untested, index=data_index)
-
-    full.loc[mask] = partial.loc[mask]
+    partial = np.asarray(qc_func(**args, **kwargs), dtype=np.int8)
 
-    return full
+    return np.where(mask, partial, untested)
 
 
 def _run_qc_engine(
@@ -103,6 +99,7 @@ def _run_qc_engine(
     qc_inputs: Mapping[str, Any],
     groups: Iterable[tuple[Any | None, pd.DataFrame | pd.Series]],
     return_method: Literal["all", "passed", "failed"],
+    n_jobs: int = 1,
 ) -> pd.DataFrame | pd.Series:
     """
     Execute QC checks on the provided data groups and collect the results.
@@ -119,98 +116,252 @@ def _run_qc_engine(
         Dictionary of QC inputs, each containing:
         {"function": callable, "requests": dict, "kwargs": dict}.
     groups : Iterable
-        Iterable of (group_name, group_df) pairs, as returned by `_group_iterator`.
+        Iterable of (group_name, group) pairs, where each group is either a
+        DataFrame/Series slice (as returned by `_group_iterator`) or row
+        positions given as a slice or an ndarray of integers (as returned
+        by `_iter_group_positions`).
     return_method : {"all", "passed", "failed"}, default: "all"
         If "all", return QC dictionary containing all requested QC check flags.
         If "passed": return QC dictionary containing all requested QC check flags until the first check passes.
         Other QC checks are flagged as unstested (3).
         If "failed": return QC dictionary containing all requested QC check flags until the first check fails.
         Other QC checks are flagged as unstested (3).
+    n_jobs : int, default: 1
+        Number of joblib workers used to process groups concurrently.
+        Only effective with `return_method` "all", where groups are fully
+        independent; "passed" and "failed" fall back to serial execution.
+        Use -1 for all available cores.
 
     Returns
     -------
     pandas.DataFrame
         DataFrame of QC results with the same index as `data` and columns
-        corresponding to QC names.
+        corresponding to QC names. Flags are stored as ``int8`` since they
+        only take the values passed (0), failed (1) and untested (3).
     """
-    mask = pd.Series(True, index=data.index)
-    results = pd.DataFrame(untested, index=data.index, columns=qc_inputs.keys())
-
-    for _, gdf in groups:
-        group_mask = mask.loc[gdf.index].copy()
-
-        for qc_name, qc in qc_inputs.items():
-            if not group_mask.any():
+    index = data.index
+    number_of_rows = len(data)
+    # One contiguous array per QC; the DataFrame is only assembled once all
+    # groups have been processed
+    result_columns = {qc_name: np.full(number_of_rows, untested, dtype=np.int8) for qc_name in qc_inputs}
+
+    # Resolve the flag that stops a row's QC chain once, so mask propagation
+    # is a single branch and two ndarray operations per QC; "all" needs no
+    # mask at all
+    stop_flag = None
+    if return_method == "failed":
+        stop_flag = failed
+    elif return_method == "passed":
+        stop_flag = passed
+    mask = np.ones(number_of_rows, dtype=bool) if stop_flag is not None else None
+
+    # QCs typically share input columns (value, lat, lon, date), so arrays
+    # are deduplicated by their underlying buffer: two Series over the same
+    # column map to one ndarray object, which lets the group loop slice each
+    # distinct array only once per group
+    converted: dict[tuple[int, tuple[int, ...], tuple[int, ...], str], np.ndarray] = {}
+
+    def shared_array(series: pd.Series) -> np.ndarray:
+        """Convert `series` to an ndarray, reusing one object per underlying buffer."""
+        arr = series.to_numpy()
+        key = (arr.__array_interface__["data"][0], arr.strides, arr.shape, str(arr.dtype))
+        return converted.setdefault(key, arr)
+
+    # Split each QC's arguments once into per-row values (carried as ndarrays
+    # and sliced per group) and constants passed through unchanged; the group
+    # loop then never inspects argument types again
+    prepared = {}
+    for qc_name, qc in qc_inputs.items():
+        series_requests = {k: shared_array(v) for k, v in qc["requests"].items() if isinstance(v, pd.Series)}
+        scalar_requests = {k: v for k, v in qc["requests"].items() if not isinstance(v, pd.Series)}
+        series_kwargs = {k: shared_array(v) for k, v in qc["kwargs"].items() if isinstance(v, pd.Series)}
+        scalar_kwargs = {k: v for k, v in qc["kwargs"].items() if not isinstance(v, pd.Series)}
+        prepared[qc_name] = (qc["function"], series_requests, scalar_requests, series_kwargs, scalar_kwargs)
+
+    def resolve_positions(group_rows: slice | np.ndarray | pd.DataFrame | pd.Series) -> slice | np.ndarray:
+        """Resolve a group to the positions of its rows in `data`."""
+        # With integer positions every access is positional instead of a
+        # label-based lookup per argument per QC. A slice covers the
+        # whole-data "group" without any copies: slicing the argument
+        # arrays and the mask returns views.
+        if isinstance(group_rows, (slice, np.ndarray)):
+            return group_rows
+        if group_rows.index is index:
+            return slice(None)
+        return index.get_indexer(group_rows.index)
+
+    def run_qc(qc_name: str, positions: slice | np.ndarray) -> None:
+        """Run one QC over one group and write its flags (mask-free path)."""
+        qc_func, series_requests, scalar_requests, series_kwargs, scalar_kwargs = prepared[qc_name]
+        args = {**scalar_requests, **{k: arr[positions] for k, arr in series_requests.items()}}
+        kwa = {**scalar_kwargs, **{k: arr[positions] for k, arr in series_kwargs.items()}}
+        result_columns[qc_name][positions] = np.asarray(qc_func(**args, **kwa))
+
+    def run_group(group_rows: slice | np.ndarray | pd.DataFrame | pd.Series) -> None:
+        """Run every QC on one group and write its flags into `result_columns`."""
+        positions = resolve_positions(group_rows)
+
+        # Arrays shared between QCs are sliced once per group
+        slice_cache: dict[int, np.ndarray] = {}
+
+        def arg_slice(arr: np.ndarray) -> np.ndarray:
+            """Slice `arr` at the group's positions, once per distinct array."""
+            key = id(arr)
+            sliced = slice_cache.get(key)
+            if sliced is None:
+                sliced = arr[positions]
+                slice_cache[key] = sliced
+            return sliced
+
+        # Without a stop flag every row stays active for every QC, so the
+        # mask bookkeeping is dead weight and the inner loop is mask-free
+        if stop_flag is None:
+            for qc_name, (qc_func, series_requests, scalar_requests, series_kwargs, scalar_kwargs) in prepared.items():
+                args = {**scalar_requests, **{k: arg_slice(arr) for k, arr in series_requests.items()}}
+                kwa = {**scalar_kwargs, **{k: arg_slice(arr) for k, arr in series_kwargs.items()}}
+                result_columns[qc_name][positions] = np.asarray(qc_func(**args, **kwa))
+            return
+
+        group_mask = mask[positions]
+        # While every row of the group is still active the untested merge is
+        # a no-op, so the QC result can be stored directly. The QC always
+        # sees the full group: sequential checks depend on neighbouring
+        # reports, so rows cannot be filtered out before the call.
+        unmasked = bool(group_mask.all())
+
+        for qc_name, (qc_func, series_requests, scalar_requests, series_kwargs, scalar_kwargs) in prepared.items():
+            if not unmasked and not group_mask.any():
                 break
 
-            args = {k: (v.loc[gdf.index] if isinstance(v, pd.Series) else v) for k, v in qc["requests"].items()}
-            kwa = {k: (v.loc[gdf.index] if isinstance(v, pd.Series) else v) for k, v in qc["kwargs"].items()}
-
-            full = _apply_qc_to_masked_rows(
-                qc_func=qc["function"],
-                args=args,
-                kwargs=kwa,
-                data_index=gdf.index,
-                mask=group_mask,
-            )
-
-            results.loc[gdf.index, qc_name] = full
-
-            if return_method == "failed":
-                group_mask &= full != failed
-                mask.loc[gdf.index] &= full != failed
-            elif return_method == "passed":
-                group_mask &= full != passed
-                mask.loc[gdf.index] &= full != passed
+            args = {**scalar_requests, **{k: arg_slice(arr) for k, arr in series_requests.items()}}
+            kwa = {**scalar_kwargs, **{k: arg_slice(arr) for k, arr in series_kwargs.items()}}
+
+            if unmasked:
+                full = np.asarray(qc_func(**args, **kwa))
+            else:
+                full = _apply_qc_to_masked_rows(
+                    qc_func=qc_func,
+                    args=args,
+                    kwargs=kwa,
+                    mask=group_mask,
+                )
+
+            result_columns[qc_name][positions] = full
+
+            if stop_flag is not None:
+                group_mask &= full != stop_flag
+                mask[positions] = group_mask
+                unmasked = unmasked and bool(group_mask.all())
+
+    if n_jobs != 1 and stop_flag is None:
+        # With "all" the mask is untouched, so every (group, QC) pair is an
+        # independent task that writes to its own region of its own result
+        # column. Dispatching at that granularity also parallelizes the
+        # ungrouped case, where there is only one group but many QCs;
+        # threads are preferred since the QC functions spend their time in
+        # NumPy and release the GIL there.
+        resolved = [resolve_positions(group_rows) for _, group_rows in groups]
+        Parallel(n_jobs=n_jobs, prefer="threads", require="sharedmem")(delayed(run_qc)(qc_name, positions) for positions in resolved for qc_name in prepared)
+    else:
+        for _, group_rows in groups:
+            run_group(group_rows)
 
-    return results
+    return pd.DataFrame(result_columns, index=index)
 
 
-def _normalize_groupby(
+def _group_iterator(
     data: pd.DataFrame | pd.Series,
-    groupby: str | pd.core.groupby.generic.DataFrameGroupBy | None,
-) -> list[tuple[Any, pd.DataFrame]]:
+    groupby: str | Iterable[str] | pd.core.groupby.generic.DataFrameGroupBy | None,
+) -> Iterator[tuple[Any | None, pd.DataFrame | pd.Series]]:
     """
-    Return iterable of (name, group_df) pairs, trimming invalid rows.
+    Yield groups of a DataFrame as (group_name, group_df) pairs.
+
+    If `groupby` is None, yields the entire DataFrame as a single group.
+    Groups from a groupby object are trimmed to rows present in `data` and
+    dropped when empty. Groups are built one at a time; the full list of
+    per-group slices is never materialized.
 
     Parameters
     ----------
-    data : pandas.Series or pandas.DataFrame
-        Hashable input data.
-    groupby : DataFrameGroupBy or object
-        A groupby object or column(s) to group by. If None, the full DataFrame is returned as a single group.
+    data : pandas.DataFrame or pandas.Series
+        The DataFrame to iterate over in groups.
+    groupby : str, iterable of str, DataFrameGroupBy, or None
+        Column(s) or a groupby object to split `data` into groups. If None,
+        the full DataFrame is returned as a single group.
 
-    Returns
-    -------
-    list[tuple[Any, pandas.DataFrame]]
-        A list of tuples containing the group name (or None) and the corresponding DataFrame slice.
+    Yields
+    ------
+    tuple of (Any, pandas.DataFrame)
+        Tuples containing the group key (or None) and the corresponding
+        DataFrame for that group.
     """
     if groupby is None:
-        return [(None, data)]
+        yield None, data
+        return
 
     if not isinstance(groupby, pd.core.groupby.generic.DataFrameGroupBy):
-        return list(data.groupby(groupby, group_keys=False, sort=False))
+        yield from data.groupby(groupby, group_keys=False, sort=False)
+        return
+
+    index = data.index
+    if groupby.obj is data or groupby.obj.index.equals(index):
+        # The GroupBy was built on the same rows, so no group can contain
+        # rows missing from `data` and the defensive trimming is skipped
+        yield from groupby
+        return
+    for name, group in groupby:
+        # A single hashed get_indexer pass instead of building an
+        # intersection Index (and its hash set) per group
+        keep = index.get_indexer(group.index) >= 0
+        if keep.all():
+            yield name, group
+        elif keep.any():
+            yield name, group.iloc[keep]
 
-    valid = data.index
-    groups = []
 
-    for name, group in groupby:
-        idx = group.index.intersection(valid)
-        if len(idx) > 0:
-            groups.append((name, group.loc[idx]))
+def _as_slice(positions: np.ndarray) -> slice | np.ndarray:
+    """
+    Return a slice covering `positions` when they are contiguous.
 
-    return groups
+    Slicing an ndarray returns a view while fancy indexing copies, so
+    describing a contiguous run of rows as a slice lets the QC engine pass
+    argument views instead of per-group copies. Non-contiguous positions
+    are returned unchanged.
 
+    Parameters
+    ----------
+    positions : numpy.ndarray
+        Integer positions of a group's rows.
 
-def _group_iterator(
+    Returns
+    -------
+    slice or numpy.ndarray
+        Equivalent slice if `positions` is a contiguous ascending run,
+        otherwise `positions` itself.
+    """
+    number_of_positions = len(positions)
+    if number_of_positions == 0:
+        return positions
+    start = int(positions[0])
+    stop = int(positions[-1]) + 1
+    if stop - start == number_of_positions and (number_of_positions < 3 or bool((np.diff(positions) == 1).all())):
+        return slice(start, stop)
+    return positions
+
+
+def _iter_group_positions(
     data: pd.DataFrame | pd.Series,
     groupby: str | Iterable[str] | pd.core.groupby.generic.DataFrameGroupBy | None,
-) -> Iterator[tuple[Any | None, pd.DataFrame | pd.Series]]:
+) -> Iterator[tuple[Any | None, slice | np.ndarray]]:
     """
-    Yield groups of a DataFrame as (group_name, group_df) pairs.
+    Yield groups of a DataFrame as (group_name, row_positions) pairs.
 
-    If `groupby` is None, yields the entire DataFrame as a single group.
-    Otherwise, yields each group as returned by `_normalize_groupby`.
+    Unlike `_group_iterator`, no per-group DataFrame slices are built: each
+    group is resolved to the integer positions of its rows in `data`, which
+    is all the QC engine needs. Without a `groupby` the single whole-data
+    group is described by a plain slice, so the engine can take views
+    instead of copies. Groups from a groupby object are trimmed to rows
+    present in `data` and dropped when empty.
 
     Parameters
     ----------
@@ -222,14 +373,31 @@ def _group_iterator(
 
     Yields
     ------
-    tuple of (Any, pandas.DataFrame)
-        Tuples containing the group key (or None) and the corresponding
-        DataFrame for that group.
+    tuple of (Any, slice or numpy.ndarray)
+        Tuples containing the group key (or None) and the positions of the
+        group's rows in `data`, as a slice or an integer ndarray.
     """
     if groupby is None:
-        yield None, data
-    else:
-        yield from _normalize_groupby(data, groupby)
+        yield None, slice(None)
+        return
+
+    if isinstance(groupby, pd.core.groupby.generic.DataFrameGroupBy):
+        index = data.index
+        if groupby.obj is data or groupby.obj.index.equals(index):
+            # The GroupBy was built on the same rows, so its positions are
+            # positions in `data` and the defensive trimming is pure waste
+            for name, positions in groupby.indices.items():
+                yield name, _as_slice(positions)
+            return
+        for name, labels in groupby.groups.items():
+            positions = index.get_indexer(labels)
+            positions = positions[positions >= 0]
+            if positions.size > 0:
+                yield name, _as_slice(positions)
+        return
+
+    for name, positions in data.groupby(groupby, sort=False).indices.items():
+        yield name, _as_slice(positions)
 
 
 def _get_requests_from_params(
@@ -270,10 +438,20 @@ def _get_requests_from_params(
     requests: dict[str, pd.Series | Any] = {}
     if params is None:
         return requests
+    # Hoist both membership sets out of the loop; the checks below are then
+    # pure O(1) lookups per parameter
+    func_params = _func_params(func)
+    accepts_kwargs = "kwargs" in func_params
+    if isinstance(data, pd.Series):
+        valid_names = frozenset((data.name,))
+    elif isinstance(data, pd.DataFrame):
+        valid_names = frozenset(data.columns)
+    else:
+        raise TypeError(f"Unsupported data type: {type(data)}")
     for param, cname in params.items():
-        if not is_func_param(func, param):
+        if not accepts_kwargs and param not in func_params:
             raise ValueError(f"Parameter '{param}' is not a valid parameter of function '{func.__name__}'")
-        if not is_in_data(cname, data):
+        if cname not in valid_names:
             raise NameError(f"Variable '{cname}' is not available in input data: {data}.")
         requests[param] = data[cname]
     return requests
@@ -299,12 +477,9 @@ def _get_preprocessed_args(arguments: Mapping[str, str], preprocessed: Mapping[s
         Dictionary of key value pairs where values in arguments that were set to __preprocessed__ were replaced by
         values from the dictionary preprocessed.
     """
-    args = {}
-    for k, v in arguments.items():
-        if isinstance(v, str) and v == "__preprocessed__":
-            v = preprocessed[k]
-        args[k] = v
-    return args
+    # The isinstance guard keeps the sentinel comparison a plain string
+    # equality; array-valued arguments are never compared elementwise
+    return {k: preprocessed[k] if isinstance(v, str) and v == "__preprocessed__" else v for k, v in arguments.items()}
 
 
 def _get_function(name: str) -> Callable[..., Any]:
@@ -326,17 +501,102 @@ def _get_function(name: str) -> Callable[..., Any]:
     NameError
         If a callable with the given name does not exist.
     """
-    func = globals().get(name)
+    func = _QC_REGISTRY.get(name)
+    if func is None:
+        # Callables defined after the registry was frozen (e.g. in an
+        # interactive session) are still resolvable
+        func = globals().get(name)
     if not callable(func):
         raise NameError(f"Function '{name}' is not defined.")
     return cast(Callable[..., Any], func)
 
 
+def _resolve_config(config: Mapping[str, Mapping[str, Any]]) -> Mapping[str, Any]:
+    """
+    Validate a configuration dictionary and resolve its data-independent parts.
+
+    Function names are looked up, inputs are normalized to sequences and the
+    raw arguments are carried along unchanged. The result can be reused across
+    repeated `_prepare_functions` calls (e.g. for streamed data chunks) so
+    validation and name resolution run only once per configuration.
+
+    Parameters
+    ----------
+    config : Mapping[str, Mapping[str, Any]]
+        Dictionary describing functions, their inputs, and arguments.
+
+    Returns
+    -------
+    Mapping[str, Any]
+        Dict mapping names to dicts:
+        `{"function": callable, "inputs": tuple, "arguments": dict, "names": dict or None}`.
+
+    Raises
+    ------
+    ValueError
+        If 'func' is missing from a configuration entry.
+    """
+    validate_dict(config)
+
+    resolved: dict[str, Any] = {}
+
+    for name, params in config.items():
+        if "func" not in params:
+            raise ValueError(f"'func' is not specified in {params}.")
+
+        func = _get_function(params["func"])
+
+        args = params.get("inputs", [])
+        if not isinstance(args, (list, tuple)):
+            args = (args,)
+
+        resolved[name] = {
+            "function": func,
+            "inputs": args,
+            "arguments": params.get("arguments", {}),
+            "names": params.get("names"),
+        }
+
+    return resolved
+
+
+def _compile_plan(
+    qc_dict: Mapping[str, Any] | None,
+    preproc_dict: Mapping[str, Any] | None = None,
+) -> Mapping[str, Mapping[str, Any]]:
+    """
+    Resolve the data-independent parts of QC and preprocessing configurations.
+
+    Callers that apply the same configuration to many data chunks (e.g. a
+    streaming pipeline) compile the plan once and pass it to
+    `_do_multiple_check`; validation, function-name resolution and input
+    normalization then run once instead of per chunk.
+
+    Parameters
+    ----------
+    qc_dict : Mapping or None
+        Dictionary defining QC functions and their arguments.
+    preproc_dict : Mapping or None
+        Dictionary defining preprocessing steps.
+
+    Returns
+    -------
+    Mapping[str, Mapping[str, Any]]
+        Dict with keys "qc" and "preproc", each holding the resolved
+        configuration as returned by `_resolve_config`.
+    """
+    return {
+        "qc": _resolve_config(qc_dict or {}),
+        "preproc": _resolve_config(preproc_dict or {}),
+    }
+
+
 def _prepare_functions(
     config: Mapping[str, Mapping[str, Any]],
     data: pd.DataFrame | pd.Series,
     preprocessed: Mapping[str, Any] | None = None,
     execute: bool = False,
+    resolved: Mapping[str, Any] | None = None,
 ) -> Mapping[str, Any]:
     """
     Prepare functions defined in a configuration dictionary.
@@ -352,6 +612,10 @@ def _prepare_functions(
     execute : bool, default: False
         If True, execute the functions and return their results.
         If False, return function references and resolved arguments.
+    resolved : Mapping[str, Any], optional
+        Pre-resolved configuration from `_resolve_config`. If given, `config`
+        is not validated again; callers processing many data chunks with the
+        same configuration resolve it once and pass it here.
 
     Returns
     -------
@@ -360,32 +624,26 @@ def _prepare_functions(
         If `execute=False`, returns a dict mapping names to dicts:
         `{"function": callable, "requests": dict, "kwargs": dict}`.
     """
-    validate_dict(config)
+    if resolved is None:
+        resolved = _resolve_config(config)
 
     results: dict[str, Any] = {}
 
-    for name, params in config.items():
-        if "func" not in params:
-            raise ValueError(f"'func' is not specified in {params}.")
-
-        func = _get_function(params["func"])
-
-        args = params.get("inputs", [])
-        if not isinstance(args, (list, tuple)):
-            args = (args,)
+    for name, entry in resolved.items():
+        func = entry["function"]
 
-        arguments = params.get("arguments", {})
+        arguments = entry["arguments"]
         if preprocessed is not None:
             arguments = _get_preprocessed_args(arguments, preprocessed)
 
-        requests = _get_requests_from_params(params.get("names"), func, data)
+        requests = _get_requests_from_params(entry["names"], func, data)
 
         kwargs = {**requests, **arguments}
 
-        validate_args(func, args=args, kwargs=kwargs)
+        validate_args(func, args=entry["inputs"], kwargs=kwargs)
 
         if execute:
-            results[name] = func(*args, **kwargs)
+            results[name] = func(*entry["inputs"], **kwargs)
         else:
             results[name] = {"function": func, "requests": requests, "kwargs": arguments}
 
@@ -396,6 +654,7 @@ def _prepare_all_inputs(
     data: pd.DataFrame | pd.Series,
     qc_dict: Mapping[str, Any] | None,
     preproc_dict: Mapping[str, Any] | None,
+    plan: Mapping[str, Mapping[str, Any]] | None = None,
 ) -> tuple[Mapping[str, Any], pd.Series, pd.DataFrame]:
     """
     Build all inputs required for QC execution.
@@ -411,22 +670,27 @@ def _prepare_all_inputs(
         Dictionary defining QC functions and their arguments.
     preproc_dict : Mapping or None
         Dictionary defining preprocessing steps.
+    plan : Mapping, optional
+        Compiled plan from `_compile_plan`. If given, the configurations are
+        not validated and resolved again.
 
     Returns
     -------
     tuple of (Mapping, pandas.Series, pandas.DataFrame)
         - QC inputs dictionary: {qc_name: {function, requests, kwargs}}.
         - Initial boolean mask Series (all True).
-        - Empty results DataFrame with shape (n_rows, n_qcs).
+        - Empty ``int8`` results DataFrame with shape (n_rows, n_qcs).
     """
     qc_dict = qc_dict or {}
     preproc_dict = preproc_dict or {}
+    if plan is None:
+        plan = _compile_plan(qc_dict, preproc_dict)
 
-    preprocessed = _prepare_functions(preproc_dict, data, execute=True)
-    qc_inputs = _prepare_functions(qc_dict, data, preprocessed=preprocessed)
+    preprocessed = _prepare_functions(preproc_dict, data, execute=True, resolved=plan["preproc"])
+    qc_inputs = _prepare_functions(qc_dict, data, preprocessed=preprocessed, resolved=plan["qc"])
 
     mask = pd.Series(True, index=data.index)
-    results = pd.DataFrame(untested, index=data.index, columns=qc_inputs.keys())
+    results = pd.DataFrame(untested, index=data.index, columns=qc_inputs.keys(), dtype=np.int8)
 
     return qc_inputs, mask, results
 
@@ -468,6 +732,8 @@ def _do_multiple_check(
     qc_dict: Mapping[str, Any] | None = None,
     preproc_dict: Mapping[str, Any] | None = None,
     return_method: Literal["all", "passed", "failed"] = "all",
+    n_jobs: int = 1,
+    plan: Mapping[str, Mapping[str, Any]] | None = None,
 ) -> pd.DataFrame | pd.Series:
     """
     Internal entry point for performing QC checks on data.
@@ -506,18 +772,26 @@ def _do_multiple_check(
         Other QC checks are flagged as unstested (3).
         If "failed": return QC dictionary containing all requested QC check flags until the first check fails.
         Other QC checks are flagged as unstested (3).
+    n_jobs : int, default: 1
+        Number of joblib workers used to process groups concurrently.
+        Only effective with `return_method` "all"; use -1 for all
+        available cores.
+    plan : Mapping, optional
+        Compiled plan from `_compile_plan`. Callers applying the same
+        configuration to many data chunks pass it here to skip repeated
+        validation and name resolution.
 
     Returns
     -------
     pandas.DataFrame or pandas.Series
         A DataFrame (or Series if the input was a Series) whose columns correspond
         to the QC names in ``qc_dict`` and whose values contain QC flags for each row.
-        Flags depend on the QC functions used.
+        Flags depend on the QC functions used and are stored as ``int8``.
     """
     data, is_series = _normalize_input(data, return_method)
-    qc_inputs, mask, results = _prepare_all_inputs(data, qc_dict, preproc_dict)
-    groups = _group_iterator(data, groupby)
-    results = _run_qc_engine(data, qc_inputs, groups, return_method)
+    qc_inputs, mask, results = _prepare_all_inputs(data, qc_dict, preproc_dict, plan=plan)
+    groups = _iter_group_positions(data, groupby)
+    results = _run_qc_engine(data, qc_inputs, groups, return_method, n_jobs=n_jobs)
     return results.iloc[0] if is_series else results
 
 
@@ -526,6 +800,7 @@ def do_multiple_individual_check(
     qc_dict: Mapping[str, Any] | None = None,
     preproc_dict: Mapping[str, Any] | None = None,
     return_method: Literal["all", "passed", "failed"] = "all",
+    n_jobs: int = 1,
 ) -> pd.DataFrame | pd.Series:
     """
     Apply one or more quality-control (QC) functions independently to each row of a DataFrame or Series.
@@ -554,13 +829,17 @@ def do_multiple_individual_check(
         Other QC checks are flagged as unstested (3).
         If "failed": return QC dictionary containing all requested QC check flags until the first check fails.
         Other QC checks are flagged as unstested (3).
+    n_jobs : int, default: 1
+        Number of joblib workers used to run independent QC checks
+        concurrently. Only effective with `return_method` "all"; use -1
+        for all available cores.
 
     Returns
     -------
     pandas.DataFrame or pandas.Series
         A DataFrame (or Series if the input was a Series) whose columns correspond
         to the QC names in ``qc_dict`` and whose values contain QC flags for each row.
-        Flags depend on the QC functions used.
+        Flags depend on the QC functions used and are stored as ``int8``.
 
     Raises
     ------
@@ -671,6 +950,7 @@ def do_multiple_individual_check(
         qc_dict=qc_dict,
         preproc_dict=preproc_dict,
         return_method=return_method,
+        n_jobs=n_jobs,
     )
 
 
@@ -680,6 +960,7 @@ def do_multiple_sequential_check(
     qc_dict: Mapping[str, Any] | None = None,
     preproc_dict: Mapping[str, Any] | None = None,
     return_method: Literal["all", "passed", "failed"] = "all",
+    n_jobs: int = 1,
 ) -> pd.DataFrame | pd.Series:
     """
     Apply one or more sequential quality-control (QC) functions to groups of a DataFrame or Series.
@@ -717,13 +998,17 @@ def do_multiple_sequential_check(
         Other QC checks are flagged as unstested (3).
         If "failed": return QC dictionary containing all requested QC check flags until the first check fails.
         Other QC checks are flagged as unstested (3).
+    n_jobs : int, default: 1
+        Number of joblib workers used to process groups concurrently.
+        Only effective with `return_method` "all", where groups are fully
+        independent; use -1 for all available cores.
 
     Returns
     -------
     pandas.DataFrame or pandas.Series
         A DataFrame (or Series if the input was a Series) whose columns correspond
         to the QC names in ``qc_dict`` and whose values contain QC flags for each row.
-        Flags depend on the QC functions used.
+        Flags depend on the QC functions used and are stored as ``int8``.
 
     Raises
     ------
@@ -748,6 +1033,7 @@ def do_multiple_sequential_check(
         qc_dict=qc_dict,
         preproc_dict=preproc_dict,
         return_method=return_method,
+        n_jobs=n_jobs,
     )
 
 
@@ -790,7 +1076,7 @@ def do_multiple_grouped_check(
     pandas.DataFrame or pandas.Series
         A DataFrame (or Series if the input was a Series) whose columns correspond
         to the QC names in ``qc_dict`` and whose values contain QC flags for each row.
-        Flags depend on the QC functions used.
+        Flags depend on the QC functions used and are stored as ``int8``.
 
     Raises
     ------
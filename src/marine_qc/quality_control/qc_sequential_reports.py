@@ -27,16 +27,16 @@ from ..helpers.auxiliary import (
 from ..helpers.spherical_geometry import sphere_distance
 from ..helpers.time_control import time_difference
 from .track_check_utils import (
+    _check_distance_from_estimate,
+    _direction_continuity,
+    _speed_continuity,
     backward_discrepancy,
     calculate_course_parameters,
     calculate_midpoint,
     calculate_speed_course_distance_time_difference,
-    check_distance_from_estimate,
-    direction_continuity,
     forward_discrepancy,
     modal_speed,
     set_speed_limits,
-    speed_continuity,
 )
 
 
@@ -120,7 +120,7 @@ def do_spike_check(
 
     number_of_obs = len(value)
 
-    spike_qc = np.asarray([passed] * number_of_obs)  # type: np.ndarray
+    spike_qc = np.full(number_of_obs, passed)  # type: np.ndarray
 
     for t1 in range(number_of_obs):
         violations_for_this_report = []
@@ -235,6 +235,12 @@ def do_track_check(
     -----
     If number of observations is less than three, the track check always passes.
 
+    To check many ships, pass the combined DataFrame through
+    :py:func:`~marine_qc.do_multiple_sequential_check` grouped by ship
+    identifier; each group is handed to this function as a contiguous slice,
+    so the per-ship work stays a handful of vectorized passes rather than
+    per-report Python calls.
+
     In previous versions, the default values of the parameters were:
 
     * max_direction_change = 60.0
@@ -252,7 +258,7 @@ def do_track_check(
 
     # fewer than three obs - set the fewsome flag
     if number_of_obs < 3:
-        return np.asarray([passed] * number_of_obs)
+        return np.full(number_of_obs, passed)
 
     # work out speeds and distances between alternating points
     speed_alt, _distance_alt, _course_alt, _timediff_alt = calculate_speed_course_distance_time_difference(
@@ -320,11 +326,11 @@ def do_track_check(
 
     # Quality-control by examining the distance
     # between the calculated and reported second position.
-    thisqc_b += check_distance_from_estimate(vsi, timediff, forward_diff_from_estimated, reverse_diff_from_estimated)
+    thisqc_b += _check_distance_from_estimate(vsi, timediff, forward_diff_from_estimated, reverse_diff_from_estimated)
     # Check for continuity of direction
-    thisqc_b += direction_continuity(dsi, course, max_direction_change=max_direction_change)
+    thisqc_b += _direction_continuity(dsi, course, max_direction_change=max_direction_change)
     # Check for continuity of speed.
-    thisqc_b += speed_continuity(vsi, speed, max_speed_change=max_speed_change)
+    thisqc_b += _speed_continuity(vsi, speed, max_speed_change=max_speed_change)
 
     thisqc_b[speed > max_absolute_speed] = thisqc_b[speed > max_absolute_speed] + 10.0
 
@@ -526,7 +532,7 @@ def find_multiple_rounded_values(value: SequenceNumberType, min_count: int, thre
     if number_of_obs == 0:
         return [passed] * number_of_obs
 
-    rounded = np.asarray([passed] * number_of_obs)  # type: np.ndarray
+    rounded = np.full(number_of_obs, passed)  # type: np.ndarray
 
     valid_indices = isvalid(value)
     allcount = np.count_nonzero(valid_indices)
@@ -595,7 +601,7 @@ def find_repeated_values(value: SequenceNumberType, min_count: int, threshold: f
     if number_of_obs == 0:
         return [passed] * number_of_obs
 
-    rep = np.asarray([passed] * number_of_obs)  # type: np.ndarray
+    rep = np.full(number_of_obs, passed)  # type: np.ndarray
 
     valid_indices = isvalid(value)
 
@@ -691,7 +697,7 @@ def do_iquam_track_check(
     speed_violations = []
     count_speed_violations = []
 
-    iquam_track = np.asarray([passed] * number_of_obs)  # type: np.ndarray
+    iquam_track = np.full(number_of_obs, passed)  # type: np.ndarray
 
     for t1 in range(0, number_of_obs):
         violations_for_this_report = []
@@ -18,7 +18,6 @@ import pandas as pd
 
 from ..helpers import spherical_geometry as sg
 from ..helpers import spherical_geometry as sph
-from ..helpers import time_control
 from ..helpers.astronomical_geometry import sunangle
 from ..helpers.auxiliary import (
     SequenceDatetimeType,
@@ -32,11 +31,23 @@ from ..helpers.auxiliary import (
     post_format_return_type,
 )
 from ..helpers.spherical_geometry import (
-    course_between_points,
-    intermediate_point,
-    sphere_distance,
+    _course_and_distance,
+    _intermediate_point,
+    _sphere_distance,
 )
-from ..helpers.time_control import day_in_year, time_difference
+from ..helpers.time_control import day_in_year
+
+
+# Track-check speed constants, converted from knots to km/h once at import
+# time instead of on every call.
+_MODAL_BIN_CENTRES_KMH = np.asarray(
+    convert_to(np.maximum(np.arange(12) * 3.0 + 1.5, 8.5), "knots", "km/h"),
+    dtype=float,
+)
+_AMAX_KMH = float(np.asarray(convert_to(15.0, "knots", "km/h"), dtype=float))
+_AMAXX_KMH = float(np.asarray(convert_to(20.0, "knots", "km/h"), dtype=float))
+_MODE_THRESHOLD_KMH = float(np.asarray(convert_to(8.51, "knots", "km/h"), dtype=float))
+_MAX_SPEED_CAP_KMH = float(np.asarray(convert_to(30.0, "knots", "km/h"), dtype=float))
 
 
 def modal_speed(speeds: list[float]) -> float:
@@ -75,12 +86,11 @@ def modal_speed(speeds: list[float]) -> float:
     speeds_arr: np.ndarray = np.asarray(speeds)
     speeds_arr = np.asarray(convert_to(speeds_arr, "km/h", "knots"), dtype=float)
 
-    # Bin edges: [0, 3, 6, ..., 36], 12 bins
-    bins = np.arange(0, 37, 3)
-
-    # Digitize returns bin index starting from 1
-    bin_indices = np.digitize(speeds_arr, bins, right=False) - 1
-    bin_indices = np.clip(bin_indices, 0, 11)
+    # The 3-knot bins are uniform, so an integer divide replaces the binary
+    # search done by np.digitize; NaN speeds land in the top bin as before
+    bin_indices = np.floor_divide(speeds_arr, 3.0)
+    bin_indices = np.where(np.isnan(bin_indices), 11.0, bin_indices)
+    bin_indices = np.clip(bin_indices, 0, 11).astype(np.intp)
 
     # Count occurrences in each bin
     counts = np.bincount(bin_indices, minlength=12)
@@ -88,13 +98,8 @@ def modal_speed(speeds: list[float]) -> float:
     # Find the modal bin (first one in case of tie)
     modal_bin = np.argmax(counts)
 
-    # Bin centres: 1.5, 4.5, ..., 34.5
-    bin_centres = bins[:-1] + 1.5
-    modal_speed_knots = max(bin_centres[modal_bin], 8.5)
-
-    # Convert back to km/h
-    modal_speed_kmh = np.asarray(convert_to(modal_speed_knots, "knots", "km/h"), dtype=float)
-    return float(modal_speed_kmh)
+    # Bin centres (floored at 8.5 knots) are pre-converted to km/h
+    return float(_MODAL_BIN_CENTRES_KMH[modal_bin])
 
 
 def set_speed_limits(amode: float) -> tuple[float, float, float]:
@@ -111,17 +116,74 @@ def set_speed_limits(amode: float) -> tuple[float, float, float]:
     (float, float, float)
         Max speed, maximum max speed and min speed.
     """
-    amax = float(np.asarray(convert_to(15.0, "knots", "km/h"), dtype=float))
-    amaxx = float(np.asarray(convert_to(20.0, "knots", "km/h"), dtype=float))
     amin = 0.00
 
     if not isvalid(amode):
-        return amax, amaxx, amin
+        return _AMAX_KMH, _AMAXX_KMH, amin
+
+    if amode <= _MODE_THRESHOLD_KMH:
+        return _AMAX_KMH, _AMAXX_KMH, amin
+
+    return amode * 1.25, _MAX_SPEED_CAP_KMH, amode * 0.75
+
+
+def _increment_position(
+    alat1: np.ndarray,
+    alon1: np.ndarray,
+    avs: np.ndarray,
+    ads: np.ndarray,
+    timediff: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute latitude and longitude increments over half a time interval.
+
+    Undecorated core of :py:func:`increment_position` operating on float
+    ndarrays. Internal callers that already hold plain arrays can use this
+    directly to skip the decorator machinery.
+
+    Parameters
+    ----------
+    alat1, alon1 : numpy.ndarray
+        Latitude and longitude at the starting point in degrees.
+    avs : numpy.ndarray
+        Speed of ship in km/h.
+    ads : numpy.ndarray
+        Heading of ship in degrees.
+    timediff : numpy.ndarray
+        Time difference between the points in hours.
+
+    Returns
+    -------
+    tuple of (numpy.ndarray, numpy.ndarray)
+        Latitude and longitude increments in degrees.
+    """
+    alat1 = np.asarray(alat1, dtype=float)
+    alon1 = np.asarray(alon1, dtype=float)
+    avs = np.asarray(avs, dtype=float)
+    ads = np.asarray(ads, dtype=float)
+    timediff = np.asarray(timediff, dtype=float)
+
+    valid = ~(np.isnan(alat1) | np.isnan(alon1) | np.isnan(avs) | np.isnan(ads) | np.isnan(timediff))
 
-    if amode <= float(np.asarray(convert_to(8.51, "knots", "km/h"), dtype=float)):
-        return amax, amaxx, amin
+    if valid.all():
+        distance = avs * timediff / 2.0
+        lat, lon = sph._lat_lon_from_course_and_distance(alat1, alon1, ads, distance)
+        return lat - alat1, lon - alon1
 
-    return amode * 1.25, float(np.asarray(convert_to(30.0, "knots", "km/h"), dtype=float)), amode * 0.75
+    # NaN inputs would only propagate through the trig, so restrict the
+    # endpoint calculation to the valid subset
+    lat_out = np.full(alat1.shape, np.nan)
+    lon_out = np.full(alon1.shape, np.nan)
+
+    alat1_valid = alat1[valid]
+    alon1_valid = alon1[valid]
+    distance = avs[valid] * timediff[valid] / 2.0
+    lat, lon = sph._lat_lon_from_course_and_distance(alat1_valid, alon1_valid, ads[valid], distance)
+
+    lat_out[valid] = lat - alat1_valid
+    lon_out[valid] = lon - alon1_valid
+
+    return lat_out, lon_out
 
 
 @post_format_return_type("alat1", dtype=float, multiple=True)
@@ -157,18 +219,72 @@ def increment_position(
     1D numpy.ndarray of float
         Returns latitude and longitude increment or None and None if timediff is None.
     """
-    alat1 = np.array(alat1, dtype=float)
-    alon1 = np.array(alon1, dtype=float)
-    avs = np.array(avs, dtype=float)
-    ads = np.array(ads, dtype=float)
-    timediff = np.array(timediff, dtype=float)
+    return _increment_position(alat1, alon1, avs, ads, timediff)
 
-    distance = avs * timediff / 2.0
-    lat, lon = sph.lat_lon_from_course_and_distance(alat1, alon1, ads, distance)
-    lat = lat - alat1
-    lon = lon - alon1
 
-    return lat, lon
+def _direction_continuity(
+    dsi: np.ndarray,
+    directions: np.ndarray,
+    dsi_previous: np.ndarray | None = None,
+    max_direction_change: float = 60.0,
+) -> np.ndarray:
+    """
+    Check if reported and calculated directions are within the allowed change.
+
+    Undecorated core of :py:func:`direction_continuity` operating on float
+    ndarrays. Internal callers that already hold plain arrays can use this
+    directly to skip the decorator machinery.
+
+    Parameters
+    ----------
+    dsi : numpy.ndarray
+        Heading at current time step in degrees.
+    directions : numpy.ndarray
+        Calculated ship direction from reported positions in degrees.
+    dsi_previous : numpy.ndarray, optional
+        Heading at previous time step in degrees.
+        If None, get dsi_previous from dsi.
+    max_direction_change : float
+        Largest deviations that will not be flagged in degrees.
+
+    Returns
+    -------
+    numpy.ndarray
+        Flag array with 10.0 where the direction change is too large,
+        0.0 otherwise and NaN where the headings are invalid.
+    """
+    dsi = np.asarray(dsi, dtype=float)
+    directions = np.asarray(directions, dtype=float)
+
+    allowed_list = [0, 45, 90, 135, 180, 225, 270, 315, 360]
+    result = np.zeros(len(dsi))
+    if not isvalid(max_direction_change):
+        return result
+
+    valid = np.isin(dsi, allowed_list)
+
+    if dsi_previous is None:
+        dsi_previous = np.empty_like(dsi)
+        dsi_previous[0] = np.nan
+        dsi_previous[1:] = dsi[:-1]
+    else:
+        dsi_previous = np.asarray(dsi_previous, dtype=float)
+        valid &= np.isin(dsi_previous, allowed_list)
+
+    dsi_previous = np.atleast_1d(dsi_previous)
+
+    # Each absolute difference is computed once and the two-sided window test
+    # combined into a single flagging expression
+    diff_current = np.abs(dsi - directions)
+    diff_previous = np.abs(dsi_previous - directions)
+
+    flagged = (max_direction_change < diff_current) & (diff_current < 360 - max_direction_change)
+    flagged |= (max_direction_change < diff_previous) & (diff_previous < 360 - max_direction_change)
+
+    result[flagged] = 10.0
+    result[~valid] = np.nan
+
+    return result
 
 
 @post_format_return_type("dsi", dtype=float)
@@ -204,33 +320,63 @@ def direction_continuity(
         Returned array elements are 10.0 if the difference between reported and calculated direction is greater
         than the max_direction_change (default, 60 degrees), 0.0 otherwise.
     """
-    dsi = np.array(dsi, dtype=float)
-    directions = np.array(directions, dtype=float)
+    return _direction_continuity(dsi, directions, dsi_previous, max_direction_change)
 
-    allowed_list = [0, 45, 90, 135, 180, 225, 270, 315, 360]
-    result = np.zeros(len(dsi))
-    if not isvalid(max_direction_change):
+
+def _speed_continuity(
+    vsi: np.ndarray,
+    speeds: np.ndarray,
+    vsi_previous: np.ndarray | None = None,
+    max_speed_change: float | None = 10.0,
+) -> np.ndarray:
+    """
+    Check if reported speeds are within the allowed change from calculated speeds.
+
+    Undecorated core of :py:func:`speed_continuity` operating on float
+    ndarrays. Internal callers that already hold plain arrays can use this
+    directly to skip the decorator machinery.
+
+    Parameters
+    ----------
+    vsi : numpy.ndarray
+        Reported speed in km/h at current time step.
+    speeds : numpy.ndarray
+        Speed of ship calculated from locations at current and previous
+        time steps in km/h.
+    vsi_previous : numpy.ndarray, optional
+        Reported speed in km/h at previous time step.
+        If None, get vsi_previous from vsi.
+    max_speed_change : float, optional
+        Largest change of speed that will not raise flag in km/h.
+
+    Returns
+    -------
+    numpy.ndarray
+        Flag array with 10.0 where the speed change is too large,
+        0.0 otherwise and NaN where the reported speeds are invalid.
+    """
+    vsi = np.asarray(vsi, dtype=float)
+    speeds = np.asarray(speeds, dtype=float)
+
+    result = np.zeros(len(vsi))
+    if not isvalid(max_speed_change):
         return result
 
-    valid = np.isin(dsi, allowed_list)
+    valid = ~np.isnan(vsi)
 
-    if dsi_previous is None:
-        dsi_previous = np.roll(dsi, 1)
-        dsi_previous = dsi_previous.astype(float)
-        dsi_previous[0] = np.nan
+    if vsi_previous is None:
+        vsi_previous = np.empty_like(vsi)
+        vsi_previous[0] = np.nan
+        vsi_previous[1:] = vsi[:-1]
     else:
-        dsi_previous = np.array(dsi_previous, dtype=float)
-        valid &= np.isin(dsi_previous, allowed_list)
-
-    dsi_previous = np.atleast_1d(dsi_previous)
+        vsi_previous = np.asarray(vsi_previous, dtype=float)
+        valid &= ~np.isnan(vsi_previous)
 
-    selection1 = max_direction_change < abs(dsi - directions)
-    selection2 = abs(dsi - directions) < (360 - max_direction_change)
-    selection3 = max_direction_change < abs(dsi_previous - directions)
-    selection4 = abs(dsi_previous - directions) < (360 - max_direction_change)
+    vsi_previous = np.atleast_1d(vsi_previous)
 
+    selection1 = abs(vsi - speeds) > max_speed_change
+    selection2 = abs(vsi_previous - speeds) > max_speed_change
     result[np.logical_and(selection1, selection2)] = 10.0
-    result[np.logical_and(selection3, selection4)] = 10.0
 
     result[~valid] = np.nan
 
@@ -271,30 +417,67 @@ def speed_continuity(
         Returned array elements are 10 if the reported and calculated speeds differ by more than 10 knots,
         0 otherwise.
     """
-    vsi = np.array(vsi, dtype=float)
-    speeds = np.array(speeds, dtype=float)
+    return _speed_continuity(vsi, speeds, vsi_previous, max_speed_change)
 
-    result = np.zeros(len(vsi))
-    if not isvalid(max_speed_change):
-        return result
 
-    valid = isvalid(vsi)
+def _check_distance_from_estimate(
+    vsi: np.ndarray,
+    time_differences: np.ndarray,
+    fwd_diff_from_estimated: np.ndarray,
+    rev_diff_from_estimated: np.ndarray,
+    vsi_previous: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Check that distances from estimated positions are less than calculated distance.
+
+    Undecorated core of :py:func:`check_distance_from_estimate` operating on
+    float ndarrays. Internal callers that already hold plain arrays can use
+    this directly to skip the decorator machinery.
+
+    Parameters
+    ----------
+    vsi : numpy.ndarray
+        Reported speed in km/h at current time step.
+    time_differences : numpy.ndarray
+        Calculated time differences between reports in hours.
+    fwd_diff_from_estimated : numpy.ndarray
+        Distance in km from estimated position, estimates made forward in time.
+    rev_diff_from_estimated : numpy.ndarray
+        Distance in km from estimated position, estimates made backward in time.
+    vsi_previous : numpy.ndarray, optional
+        Reported speed in km/h at previous time step.
+        If None, get vsi_previous from vsi.
+
+    Returns
+    -------
+    numpy.ndarray
+        Flag array with 10.0 where both estimates disagree with the allowed
+        distance, 0.0 otherwise.
+    """
+    vsi = np.asarray(vsi, dtype=float)
+    time_differences = np.asarray(time_differences, dtype=float)
+    fwd_diff_from_estimated = np.asarray(fwd_diff_from_estimated, dtype=float)
+    rev_diff_from_estimated = np.asarray(rev_diff_from_estimated, dtype=float)
 
     if vsi_previous is None:
-        vsi_previous = np.roll(vsi, 1)
-        vsi_previous = vsi_previous.astype(float)
+        vsi_previous = np.empty_like(vsi)
         vsi_previous[0] = np.nan
+        vsi_previous[1:] = vsi[:-1]
     else:
-        vsi_previous = np.array(vsi_previous, dtype=float)
-        valid &= isvalid(vsi_previous)
+        vsi_previous = np.asarray(vsi_previous, dtype=float)
 
     vsi_previous = np.atleast_1d(vsi_previous)
 
-    selection1 = abs(vsi - speeds) > max_speed_change
-    selection2 = abs(vsi_previous - speeds) > max_speed_change
-    result[np.logical_and(selection1, selection2)] = 10.0
+    alwdis = time_differences * ((vsi + vsi_previous) / 2.0)
 
-    result[~valid] = np.nan
+    selection = fwd_diff_from_estimated > alwdis
+    selection = np.logical_and(selection, rev_diff_from_estimated > alwdis)
+    selection = np.logical_and(selection, vsi > 0)
+    selection = np.logical_and(selection, vsi_previous > 0)
+    selection = np.logical_and(selection, time_differences > 0)
+
+    result = np.zeros(len(vsi))
+    result[selection] = 10.0
 
     return result
 
@@ -339,34 +522,13 @@ def check_distance_from_estimate(
     TypeError
         If `inspect_arrays` does not return numpy ndarrays.
     """
-    vsi = np.array(vsi, dtype=float)
-    time_differences = np.array(time_differences, dtype=float)
-    fwd_diff_from_estimated = np.array(fwd_diff_from_estimated, dtype=float)
-    rev_diff_from_estimated = np.array(rev_diff_from_estimated, dtype=float)
-
-    valid = isvalid(vsi)
-
-    if vsi_previous is None:
-        vsi_previous = np.roll(vsi, 1)
-        vsi_previous[0] = np.nan
-    else:
-        vsi_previous = np.array(vsi_previous, dtype=float)
-        valid &= isvalid(vsi_previous)
-
-    vsi_previous = np.atleast_1d(vsi_previous)
-
-    alwdis = time_differences * ((vsi + vsi_previous) / 2.0)
-
-    selection = fwd_diff_from_estimated > alwdis
-    selection = np.logical_and(selection, rev_diff_from_estimated > alwdis)
-    selection = np.logical_and(selection, vsi > 0)
-    selection = np.logical_and(selection, vsi_previous > 0)
-    selection = np.logical_and(selection, time_differences > 0)
-
-    result = np.zeros(len(vsi))
-    result[selection] = 10.0
-
-    return result
+    return _check_distance_from_estimate(
+        vsi,
+        time_differences,
+        fwd_diff_from_estimated,
+        rev_diff_from_estimated,
+        vsi_previous,
+    )
 
 
 @convert_units(
@@ -406,21 +568,21 @@ def calculate_course_parameters(
     tuple of float
         A tuple of four floats representing the speed, distance, course and time difference.
     """
-    distance = sg.sphere_distance(lat_later, lon_later, lat_earlier, lon_earlier)
-    date_earlier = pd.Timestamp(date_earlier)
-    date_later = pd.Timestamp(date_later)
+    lat_later_arr = np.asarray(lat_later, dtype=float)
+    lat_earlier_arr = np.asarray(lat_earlier, dtype=float)
+    lon_later_arr = np.asarray(lon_later, dtype=float)
+    lon_earlier_arr = np.asarray(lon_earlier, dtype=float)
 
-    timediff = time_control.time_difference(
-        date_earlier,
-        date_later,
-    )
+    distance = float(_sphere_distance(lat_later_arr, lon_later_arr, lat_earlier_arr, lon_earlier_arr))
+
+    timediff = (pd.Timestamp(date_later) - pd.Timestamp(date_earlier)).total_seconds() / 3600.0
     if timediff != 0 and isvalid(timediff):
         speed = distance / abs(timediff)
     else:
         timediff = 0.0
         speed = distance
 
-    course = sg.course_between_points(lat_earlier, lon_earlier, lat_later, lon_later)
+    course = float(sg._course_between_points(lat_earlier_arr, lon_earlier_arr, lat_later_arr, lon_later_arr))
 
     return speed, distance, course, timediff
 
@@ -456,29 +618,25 @@ def calculate_speed_course_distance_time_difference(
     tuple of numpy.ndarray, each with float values, shape (n,)
         A tuple containing four one-dimensional arrays representing: speed, distance, course, and time difference.
     """
-    lat = np.array(lat, dtype=float)
-    lon = np.array(lon, dtype=float)
-    date = np.array(date, dtype="datetime64[ns]")
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    date = np.asarray(date, dtype="datetime64[ns]")
+
+    number_of_obs = len(lat)
+    distance = np.full(number_of_obs, np.nan)
+    timediff = np.full(number_of_obs, np.nan)
+    course = np.full(number_of_obs, np.nan)
 
     if alternating:
-        distance = sphere_distance(np.roll(lat, 1), np.roll(lon, 1), np.roll(lat, -1), np.roll(lon, -1))
-        timediff = time_difference(np.roll(date, 1), np.roll(date, -1))
-        course = course_between_points(np.roll(lat, 1), np.roll(lon, 1), np.roll(lat, -1), np.roll(lon, -1))
         # Alternating estimates are unavailable for the first and last elements
-        distance[0] = np.nan
-        distance[-1] = np.nan
-        timediff[0] = np.nan
-        timediff[-1] = np.nan
-        course[0] = np.nan
-        course[-1] = np.nan
+        if number_of_obs > 2:
+            course[1:-1], distance[1:-1] = _course_and_distance(lat[:-2], lon[:-2], lat[2:], lon[2:])
+            timediff[1:-1] = (date[2:] - date[:-2]) / np.timedelta64(1, "h")
     else:
-        distance = sphere_distance(np.roll(lat, 1), np.roll(lon, 1), lat, lon)
-        timediff = time_difference(np.roll(date, 1), date)
-        course = course_between_points(np.roll(lat, 1), np.roll(lon, 1), lat, lon)
         # With the regular first differences, we don't have anything for the first element
-        distance[0] = np.nan
-        timediff[0] = np.nan
-        course[0] = np.nan
+        if number_of_obs > 1:
+            course[1:], distance[1:] = _course_and_distance(lat[:-1], lon[:-1], lat[1:], lon[1:])
+            timediff[1:] = (date[1:] - date[:-1]) / np.timedelta64(1, "h")
 
     speed = np.zeros_like(timediff)
     valid = timediff != 0.0
@@ -543,18 +701,24 @@ def forward_discrepancy(
     """
     lat, lon, date, vsi, dsi = ensure_arrays(lat=lat, lon=lon, date=date, vsi=vsi, dsi=dsi)
 
-    timediff = time_difference(np.roll(date, 1), date)
-    lat1, lon1 = increment_position(np.roll(lat, 1), np.roll(lon, 1), np.roll(vsi, 1), dsi, timediff)
+    number_of_obs = len(lat)
+    distance_from_est_location = np.full(number_of_obs, np.nan)
+    if number_of_obs < 2:
+        return distance_from_est_location
 
-    lat2, lon2 = increment_position(lat, lon, vsi, dsi, timediff)
+    # A forward estimate is only available from the second report onwards, so
+    # shifted slice views replace the former np.roll copies. One datetime64
+    # conversion covers the whole track; NaT differences become NaN.
+    date = pd.to_datetime(date, errors="coerce").values
+    timediff = (date[1:] - date[:-1]) / np.timedelta64(1, "h")
+    lat1, lon1 = _increment_position(lat[:-1], lon[:-1], vsi[:-1], dsi[1:], timediff)
+    lat2, lon2 = _increment_position(lat[1:], lon[1:], vsi[1:], dsi[1:], timediff)
 
-    updated_latitude = np.roll(lat, 1) + lat1 + lat2
-    updated_longitude = np.roll(lon, 1) + lon1 + lon2
+    updated_latitude = lat[:-1] + lat1 + lat2
+    updated_longitude = lon[:-1] + lon1 + lon2
 
     # calculate distance between calculated position and the second reported position
-    distance_from_est_location = sphere_distance(lat, lon, updated_latitude, updated_longitude)
-
-    distance_from_est_location[0] = np.nan
+    distance_from_est_location[1:] = _sphere_distance(lat[1:], lon[1:], updated_latitude, updated_longitude)
 
     return distance_from_est_location
 
@@ -615,24 +779,32 @@ def backward_discrepancy(
     """
     lat, lon, date, vsi, dsi = ensure_arrays(lat=lat, lon=lon, date=date, vsi=vsi, dsi=dsi)
 
-    timediff = time_difference(np.roll(date, 1), date)
-    lat2, lon2 = increment_position(
-        np.roll(lat, 1),
-        np.roll(lon, 1),
-        np.roll(vsi, 1),
-        np.roll(dsi, 1) - 180,
-        timediff,
-    )
+    number_of_obs = len(lat)
+    distance_from_est_location = np.full(number_of_obs, np.nan)
+    if number_of_obs < 2:
+        return distance_from_est_location
 
-    lat1, lon1 = increment_position(lat, lon, vsi, dsi - 180, timediff)
+    # The first element keeps its historical wrap-around estimate from the
+    # final report, so the "previous" views shift by one with wrap-around.
+    # One datetime64 conversion covers the whole track; NaT differences
+    # become NaN.
+    date = pd.to_datetime(date, errors="coerce").values
+    lat_previous = np.concatenate((lat[-1:], lat[:-2]))
+    lon_previous = np.concatenate((lon[-1:], lon[:-2]))
+    vsi_previous = np.concatenate((vsi[-1:], vsi[:-2]))
+    dsi_previous = np.concatenate((dsi[-1:], dsi[:-2]))
+    date_previous = np.concatenate((date[-1:], date[:-2]))
 
-    updated_latitude = lat + lat1 + lat2
-    updated_longitude = lon + lon1 + lon2
+    timediff = (date[:-1] - date_previous) / np.timedelta64(1, "h")
+    lat2, lon2 = _increment_position(lat_previous, lon_previous, vsi_previous, dsi_previous - 180, timediff)
 
-    # calculate distance between calculated position and the second reported position
-    distance_from_est_location = sphere_distance(np.roll(lat, 1), np.roll(lon, 1), updated_latitude, updated_longitude)
+    lat1, lon1 = _increment_position(lat[:-1], lon[:-1], vsi[:-1], dsi[:-1] - 180, timediff)
 
-    distance_from_est_location[-1] = np.nan
+    updated_latitude = lat[:-1] + lat1 + lat2
+    updated_longitude = lon[:-1] + lon1 + lon2
+
+    # calculate distance between calculated position and the second reported position
+    distance_from_est_location[:-1] = _sphere_distance(lat_previous, lon_previous, updated_latitude, updated_longitude)
 
     return distance_from_est_location
 
@@ -673,33 +845,39 @@ def calculate_midpoint(
     ValueError
         If either input is not 1-dimensional or if their lengths do not match.
     """
-    lat = np.array(lat, dtype=float)
-    lon = np.array(lon, dtype=float)
-    timediff = np.array(timediff, dtype=float)
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+    timediff = np.asarray(timediff, dtype=float)
 
     number_of_obs = len(lat)
-    midpoint_discrepancies = np.asarray([np.nan] * number_of_obs)  # type: np.ndarray
+    # The interior assignment below writes every element except the two
+    # endpoints, so only those need an explicit NaN
+    midpoint_discrepancies = np.empty(number_of_obs)  # type: np.ndarray
+
+    # Midpoint estimates need a report on either side, so only the interior
+    # is computed, on slice views instead of np.roll copies
+    if number_of_obs < 3:
+        midpoint_discrepancies.fill(np.nan)
+        return midpoint_discrepancies
 
-    t0 = timediff
-    t1 = np.roll(timediff, -1)
+    midpoint_discrepancies[0] = np.nan
+    midpoint_discrepancies[-1] = np.nan
+
+    t0 = timediff[1:-1]
+    t1 = timediff[2:]
     fraction_of_time_diff = np.zeros_like(t0)
-    valid = (t0 + t1 != 0) & isvalid(t0) & isvalid(t1)
+    valid = (t0 + t1 != 0) & ~np.isnan(t0) & ~np.isnan(t1)
     fraction_of_time_diff[valid] = t0[valid] / (t0[valid] + t1[valid])
 
-    est_midpoint_lat, est_midpoint_lon = intermediate_point(
-        np.roll(lat, 1),
-        np.roll(lon, 1),
-        np.roll(lat, -1),
-        np.roll(lon, -1),
+    est_midpoint_lat, est_midpoint_lon = _intermediate_point(
+        lat[:-2],
+        lon[:-2],
+        lat[2:],
+        lon[2:],
         fraction_of_time_diff,
     )
 
-    est_midpoint_lat[0] = np.nan
-    est_midpoint_lat[-1] = np.nan
-    est_midpoint_lon[0] = np.nan
-    est_midpoint_lon[-1] = np.nan
-
-    midpoint_discrepancies = sphere_distance(lat, lon, est_midpoint_lat, est_midpoint_lon)
+    midpoint_discrepancies[1:-1] = _sphere_distance(lat[1:-1], lon[1:-1], est_midpoint_lat, est_midpoint_lon)
 
     return midpoint_discrepancies
 
@@ -807,7 +985,5 @@ def is_monotonic(inarr: np.ndarray | Sequence[int | float]) -> bool:
     bool
         True if array is increasing monotonically, False otherwise.
     """
-    for i in range(1, len(inarr)):
-        if inarr[i] < inarr[i - 1]:
-            return False
-    return True
+    inarr = np.asarray(inarr)
+    return not bool(np.any(inarr[1:] < inarr[:-1]))
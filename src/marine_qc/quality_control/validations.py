@@ -4,6 +4,7 @@ from __future__ import annotations
 import collections.abc as abc
 import inspect
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import lru_cache
 from types import UnionType
 from typing import (
     Annotated,
@@ -50,6 +51,90 @@ from .qc_sequential_reports import (  # noqa: F401
 )
 
 
+@lru_cache(maxsize=None)
+def _signature(func: Callable[..., Any]) -> inspect.Signature:
+    """
+    Return the cached signature of a function.
+
+    Parameters
+    ----------
+    func : Callable
+        Function whose signature is to be inspected.
+
+    Returns
+    -------
+    inspect.Signature
+        The signature of `func`, built once per function.
+    """
+    return inspect.signature(func)
+
+
+@lru_cache(maxsize=None)
+def _func_params(func: Callable[..., Any]) -> frozenset[str]:
+    """
+    Return the cached parameter-name set of a function.
+
+    Parameters
+    ----------
+    func : Callable
+        Function whose parameters are to be inspected.
+
+    Returns
+    -------
+    frozenset[str]
+        Names of the parameters of `func`, built once per function.
+    """
+    return frozenset(_signature(func).parameters)
+
+
+@lru_cache(maxsize=None)
+def _type_hints(func: Callable[..., Any]) -> Mapping[str, Any]:
+    """
+    Return the cached resolved type hints of a function.
+
+    Parameters
+    ----------
+    func : Callable
+        Function whose annotations are to be resolved.
+
+    Returns
+    -------
+    Mapping[str, Any]
+        Mapping of parameter names to resolved type hints, built once per function.
+    """
+    return get_type_hints(func)
+
+
+@lru_cache(maxsize=None)
+def _reserved_keys(func: Callable[..., Any]) -> frozenset[str]:
+    """
+    Return the cached reserved keyword names of a function's decorator handlers.
+
+    Walks the chain of wrapped functions and collects the keyword arguments
+    registered by every decorator handler applied to `func`.
+
+    Parameters
+    ----------
+    func : Callable
+        The function to inspect for applied decorator handlers.
+
+    Returns
+    -------
+    frozenset[str]
+        Argument names reserved by decorator handlers, built once per function.
+    """
+    reserved: set[str] = set()
+    current: Callable[..., Any] = func
+    while True:
+        for handler in DECORATOR_HANDLERS.get(current, []):
+            reserved.update(DECORATOR_KWARGS.get(handler, set()))
+        if hasattr(current, "__wrapped__"):
+            current = current.__wrapped__
+        else:
+            break
+    return frozenset(reserved)
+
+
 def _validate_non_generic(value: Any, expected: Any) -> bool:
     """
     Validate a non-generic type (str, int, float, etc.).
@@ -300,7 +385,7 @@ def validate_arg(
     func_name: str,
     parameters: Mapping[str, inspect.Parameter],
     type_hints: Mapping[str, Any],
-    reserved_keys: set[str],
+    reserved_keys: set[str] | frozenset[str],
     has_arguments: bool,
 ) -> None:
     """
@@ -320,7 +405,7 @@ def validate_arg(
     type_hints : Mapping[str, type]
         A mapping of parameter names to expected types,
         typically from `typing.get_type_hints(func)`.
-    reserved_keys : set[str]
+    reserved_keys : set[str] or frozenset[str]
         Argument names that are considered reserved and should nor raise errors.
     has_arguments : bool
         Whether the function accepts arbitrary arguments.
@@ -367,43 +452,15 @@ def validate_args(
     TypeError
         If a required parameter of `func` is missing from `kwargs`.
     """
-
-    def all_handlers(func: Callable[..., Any]) -> list[Callable[..., Any]]:
-        """
-        Collect all decorator handlers applied to a function.
-
-        Parameters
-        ----------
-        func : Callable[..., Any]
-            The function to inspect for applied decorator handlers.
-
-        Returns
-        -------
-        List[Callable[..., Any]]
-            A list of all decorator handlers associated with the function,
-            including handlers from wrapped functions.
-        """
-        handlers: list[Callable[..., Any]] = []
-        current: Callable[..., Any] = func
-        while True:
-            handlers.extend(DECORATOR_HANDLERS.get(current, []))
-            if hasattr(current, "__wrapped__"):
-                current = current.__wrapped__
-            else:
-                break
-        return handlers
-
     args = args or ()
     if not isinstance(args, (list, tuple)):
         args = (args,)
 
     kwargs = kwargs or {}
 
-    reserved_keys: set[str] = set()
-    for handler in all_handlers(func):
-        reserved_keys.update(DECORATOR_KWARGS.get(handler, set()))
+    reserved_keys = _reserved_keys(func)
 
-    sig = inspect.signature(func)
+    sig = _signature(func)
     params = list(sig.parameters.values())
 
     positional_params = [p for p in params if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)]
@@ -417,7 +474,7 @@ def validate_args(
 
     has_kwargs = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params)
 
-    type_hints = get_type_hints(func)
+    type_hints = _type_hints(func)
 
     for i, arg in enumerate(args):
         validate_arg(bound_args[i], arg, func.__name__, sig.parameters, type_hints, reserved_keys, has_args)
@@ -514,7 +571,7 @@ def is_func_param(func: Callable[..., Any], param: str) -> bool:
     bool
         Returns True if param is one of the functions parameters or the function uses ``**kwargs``.
     """
-    sig = inspect.signature(func)
-    if "kwargs" in sig.parameters:
+    parameters = _func_params(func)
+    if "kwargs" in parameters:
         return True
-    return param in sig.parameters
+    return param in parameters
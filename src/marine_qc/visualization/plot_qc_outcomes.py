@@ -28,23 +28,15 @@ def _get_colours_labels(qc_outcomes: np.ndarray) -> tuple[np.ndarray, list[lines
     colour_failed = "#ff5555"
     colour_other = "#808080"
 
-    passed = 0
-    failed = 0
-    other = 0
-
-    colours_list = []
-    for outcome in qc_outcomes:
-        if outcome == 0:
-            colours_list.append(colour_passed)
-            passed += 1
-        elif outcome == 1:
-            colours_list.append(colour_failed)
-            failed += 1
-        else:
-            colours_list.append(colour_other)
-            other += 1
-
-    colours = np.array(colours_list, dtype=str)
+    qc_outcomes = np.asarray(qc_outcomes)
+    mask_passed = qc_outcomes == 0
+    mask_failed = qc_outcomes == 1
+
+    passed = int(mask_passed.sum())
+    failed = int(mask_failed.sum())
+    other = qc_outcomes.size - passed - failed
+
+    colours = np.where(mask_passed, colour_passed, np.where(mask_failed, colour_failed, colour_other))
 
     legend_elements = [
         lines.Line2D(
@@ -9,7 +9,7 @@ import xarray as xr
 from marine_qc import Climatology
 from marine_qc.helpers.external_clim import (
     _empty_dataarray,
-    _select_point,
+    _nearest_index,
     get_climatological_value,
     inspect_climatology,
 )
@@ -90,87 +90,52 @@ def _inspect_climatology2(climatology, **kwargs):
 
 
 @pytest.mark.parametrize(
-    "lat_coords, lon_coords, data, lat_arr, lon_arr, i, lat_axis, lon_axis, expected",
+    "coords, values, expected",
     [
-        # Exact match
-        (
-            [0.0, 1.0],
-            [10.0, 20.0],
-            [[100, 200], [300, 400]],
-            [0.0],
-            [20.0],
-            0,
-            "lat",
-            "lon",
-            200.0,
-        ),
-        # Nearest match
-        (
-            [0.0, 1.0, 2.0],
-            [10.0, 20.0, 30.0],
-            [[0, 1, 2], [10, 11, 12], [20, 21, 22]],
-            [1.1],  # nearest 1.0
-            [19.0],  # nearest 20.0
-            0,
-            "lat",
-            "lon",
-            11.0,
-        ),
-        # Custom axis names
-        (
-            [0.0, 1.0],
-            [10.0, 20.0],
-            [[5, 6], [7, 8]],
-            [1.0],
-            [10.0],
-            0,
-            "y",
-            "x",
-            7.0,
-        ),
-        # Multiple index case (i=1)
-        (
-            [0.0, 1.0],
-            [10.0, 20.0],
-            [[1, 2], [3, 4]],
-            [0.0, 1.0],
-            [10.0, 20.0],
-            1,
-            "lat",
-            "lon",
-            4.0,
-        ),
+        # Exact matches
+        ([0.0, 1.0, 2.0], [0.0, 1.0, 2.0], [0, 1, 2]),
+        # Nearest matches
+        ([0.0, 1.0, 2.0], [1.1, 0.4, 1.9], [1, 0, 2]),
+        # Values outside the axis are clamped
+        ([0.0, 1.0, 2.0], [-5.0, 10.0], [0, 2]),
+        # Ties are broken towards the higher coordinate value
+        ([0.0, 1.0, 2.0], [0.5, 1.5], [1, 2]),
+        # Descending axis
+        ([2.0, 1.0, 0.0], [1.9, 0.4, -5.0, 10.0], [0, 2, 2, 0]),
+        # Irregular axis spacing
+        ([0.0, 0.5, 3.0], [0.3, 1.0, 2.9], [1, 1, 2]),
+        # Single grid point
+        ([5.0], [-10.0, 20.0], [0, 0]),
     ],
 )
-def test_select_point(
-    lat_coords,
-    lon_coords,
-    data,
-    lat_arr,
-    lon_arr,
-    i,
-    lat_axis,
-    lon_axis,
-    expected,
-):
-    # Build DataArray
+def test_nearest_index(coords, values, expected):
+    result = _nearest_index(np.array(coords), np.array(values))
+
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_get_value_out_of_bounds():
+    lats = np.arange(-87.5, 90.0, 5.0)
+    lons = np.arange(-177.5, 180.0, 5.0)
+    time = xr.date_range("2004-01-01", periods=73, freq="5D")
     da = xr.DataArray(
-        np.array(data),
-        coords={lat_axis: lat_coords, lon_axis: lon_coords},
-        dims=(lat_axis, lon_axis),
+        np.zeros((73, len(lats), len(lons))),
+        coords={"time": time, "latitude": lats, "longitude": lons},
+        dims=["time", "latitude", "longitude"],
     )
-
-    idx, value = _select_point(
-        i=i,
-        da_slice=da,
-        lat_arr=np.array(lat_arr),
-        lon_arr=np.array(lon_arr),
-        lat_axis=lat_axis,
-        lon_axis=lon_axis,
+    da["time"].attrs["standard_name"] = "time"
+    da["latitude"].attrs.update({"standard_name": "latitude", "units": "degrees_north"})
+    da["longitude"].attrs.update({"standard_name": "longitude", "units": "degrees_east"})
+    climatology = Climatology(data=da)
+
+    result = climatology.get_value(
+        lat=[0.0, 150.0, -91.0, 0.0, 0.0],
+        lon=[0.0, 0.0, 0.0, 181.0, -200.0],
+        month=[6] * 5,
+        day=[15] * 5,
     )
 
-    assert idx == i
-    assert value == expected
+    np.testing.assert_array_equal(np.isnan(result), [False, True, True, True, True])
 
 
 def test_empty_dataarray_structure():
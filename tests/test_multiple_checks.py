@@ -14,12 +14,12 @@ from marine_qc import (
 )
 from marine_qc.quality_control.qc_multiple_checks import (
     _apply_qc_to_masked_rows,
+    _compile_plan,
     _do_multiple_check,
     _get_function,
     _get_preprocessed_args,
     _get_requests_from_params,
     _group_iterator,
-    _normalize_groupby,
     _normalize_input,
     _prepare_all_inputs,
     _prepare_functions,
@@ -214,55 +214,9 @@ def test_prepare_functions_preprocessed(df_ind, qc_dict):
 
 
 def test_apply_qc_to_masked_rows():
-    result = _apply_qc_to_masked_rows(
-        do_hard_limit_check, {"value": pd.Series([1, 2, 3, 4])}, {"limits": [2, 3]}, [0, 1, 2, 3], [True, False, True, True]
-    )
-    expected = pd.Series([failed, untested, passed, failed])
-    pd.testing.assert_series_equal(result, expected)
-
-
-def test_normalize_groupby(df_ind):
-    result1 = _normalize_groupby(df_ind, None)
-
-    assert isinstance(result1, list)
-    assert len(result1) == 1
-    assert isinstance(result1[0], tuple)
-
-    assert result1[0][0] is None
-    pd.testing.assert_frame_equal(result1[0][1], df_ind)
-
-    result2 = _normalize_groupby(df_ind, "value2")
-
-    assert isinstance(result2, list)
-    assert len(result2) == 2
-    assert isinstance(result2[0], tuple)
-
-    assert result2[0][0] == 1
-    expected = pd.DataFrame({"value1": [1, 2], "value2": [1, 1]})
-    pd.testing.assert_frame_equal(result2[0][1], expected)
-
-    assert isinstance(result2[1], tuple)
-
-    assert result2[1][0] == 2
-    expected = pd.DataFrame({"value1": [3, 4], "value2": [2, 2]}, index=[2, 3])
-    pd.testing.assert_frame_equal(result2[1][1], expected)
-
-    groupby = df_ind.groupby("value2")
-    result3 = _normalize_groupby(df_ind, groupby)
-
-    assert isinstance(result3, list)
-    assert len(result3) == 2
-    assert isinstance(result3[0], tuple)
-
-    assert result3[0][0] == 1
-    expected = pd.DataFrame({"value1": [1, 2], "value2": [1, 1]})
-    pd.testing.assert_frame_equal(result3[0][1], expected)
-
-    assert isinstance(result3[1], tuple)
-
-    assert result3[1][0] == 2
-    expected = pd.DataFrame({"value1": [3, 4], "value2": [2, 2]}, index=[2, 3])
-    pd.testing.assert_frame_equal(result3[1][1], expected)
+    result = _apply_qc_to_masked_rows(do_hard_limit_check, {"value": pd.Series([1, 2, 3, 4])}, {"limits": [2, 3]}, [True, False, True, True])
+    expected = np.array([failed, untested, passed, failed])
+    np.testing.assert_array_equal(result, expected)
 
 
 @pytest.mark.parametrize(
@@ -315,7 +269,8 @@ def test_prepare_all_inputs(df_ind, qc_dict):
     pd.testing.assert_series_equal(result[1], pd.Series([True, True, True, True]))
 
     pd.testing.assert_frame_equal(
-        result[2], pd.DataFrame({"test1": [untested, untested, untested, untested], "test2": [untested, untested, untested, untested]})
+        result[2],
+        pd.DataFrame({"test1": [untested, untested, untested, untested], "test2": [untested, untested, untested, untested]}, dtype="int8"),
     )
 
 
@@ -392,12 +347,12 @@ def test_run_qc_engine(df_ind, return_method, exp):
     groups = _group_iterator(df_ind, None)
     result = _run_qc_engine(df_ind, qc_inputs, groups, return_method)
 
-    pd.testing.assert_frame_equal(result, pd.DataFrame(exp))
+    pd.testing.assert_frame_equal(result, pd.DataFrame(exp, dtype="int8"))
 
     groups = _group_iterator(df_ind, "value2")
     result = _run_qc_engine(df_ind, qc_inputs, groups, return_method)
 
-    pd.testing.assert_frame_equal(result, pd.DataFrame(exp))
+    pd.testing.assert_frame_equal(result, pd.DataFrame(exp, dtype="int8"))
 
 
 @pytest.mark.parametrize(
@@ -411,7 +366,14 @@ def test_run_qc_engine(df_ind, return_method, exp):
 def test_do_multiple_check_basic(df_ind, qc_dict, return_method, exp):
     result = _do_multiple_check(df_ind, qc_dict=qc_dict, return_method=return_method)
 
-    pd.testing.assert_frame_equal(result, pd.DataFrame(exp))
+    pd.testing.assert_frame_equal(result, pd.DataFrame(exp, dtype="int8"))
+
+
+def test_do_multiple_check_with_plan(df_ind, qc_dict):
+    plan = _compile_plan(qc_dict)
+    expected = _do_multiple_check(df_ind, qc_dict=qc_dict)
+    result = _do_multiple_check(df_ind, qc_dict=qc_dict, plan=plan)
+    pd.testing.assert_frame_equal(result, expected)
 
 
 @pytest.mark.parametrize("param", ["qc_dict", "preproc_dict"])
@@ -524,7 +486,7 @@ def test_do_multiple_individual_check(df_ind, qc_dict, return_method, exp):
         return_method=return_method,
     )
 
-    pd.testing.assert_frame_equal(result, pd.DataFrame(exp))
+    pd.testing.assert_frame_equal(result, pd.DataFrame(exp, dtype="int8"))
 
 
 def test_multiple_individual_check_raises_return_method():
@@ -603,7 +565,24 @@ def test_multiple_sequential_check(df_seq, qc_dict_seq, return_method, exp):
         qc_dict=qc_dict_seq,
         return_method=return_method,
     )
-    pd.testing.assert_frame_equal(result, pd.DataFrame(exp))
+    pd.testing.assert_frame_equal(result, pd.DataFrame(exp, dtype="int8"))
+
+
+def test_multiple_sequential_check_parallel(df_seq, qc_dict_seq):
+    serial = do_multiple_sequential_check(
+        data=df_seq,
+        groupby="name",
+        qc_dict=qc_dict_seq,
+        return_method="all",
+    )
+    parallel = do_multiple_sequential_check(
+        data=df_seq,
+        groupby="name",
+        qc_dict=qc_dict_seq,
+        return_method="all",
+        n_jobs=2,
+    )
+    pd.testing.assert_frame_equal(parallel, serial)
 
 
 def test_multiple_grouped_check(df_seq, qc_dict_grp):